@@ -0,0 +1,158 @@
+# Listings are rendered entirely from the database, so a rendered listing stays valid until the
+# database is written to again. Cached copies are keyed on the state of the database files, which
+# means a write naturally invalidates them without any explicit bookkeeping.
+#
+# Responses from the GitHub API are also kept here, along with their ETags, so that a later request
+# for the same resource can be answered with 304 Not Modified, which does not count against the
+# rate limit. Pull requests that have been closed no longer change, so their details are reused
+# without being revalidated.
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from runner.database import DB_PATH
+
+CACHE_DIR = Path.home() / ".cache" / "autonomi" / "workflow-runner"
+
+# The number of API responses kept; the least recently used are removed beyond this.
+MAX_CACHED_RESPONSES = 200
+
+def database_state() -> str:
+    """
+    Get a token that changes whenever the database is written to.
+    
+    The write-ahead log is included because, in WAL mode, writes only reach the main database file
+    when the log is checkpointed. An empty log holds no writes, and is recreated by readers, so it
+    is treated the same as a missing one.
+    
+    Returns:
+        str: The modification times and sizes of the database and its write-ahead log
+    """
+    parts = []
+    for path in (DB_PATH, DB_PATH.with_name(DB_PATH.name + "-wal")):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            parts.append("0")
+            continue
+        parts.append(f"{stat.st_mtime_ns}-{stat.st_size}" if stat.st_size else "0")
+    return "-".join(parts)
+
+def read_cached_listing(name: str, key: str) -> Optional[str]:
+    """
+    Read a previously rendered listing.
+    
+    Args:
+        name: The name of the listing
+        key: The key the listing was rendered for
+    
+    Returns:
+        Optional[str]: The rendered listing, or None if there is no copy for the key
+    """
+    try:
+        return (CACHE_DIR / f"{name}-{key}.txt").read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+def write_cached_listing(name: str, key: str, text: str) -> None:
+    """
+    Save a rendered listing, replacing any copies rendered for other keys.
+    
+    Failing to write the cache is not an error; the listing will just be rendered again next time.
+    
+    Args:
+        name: The name of the listing
+        key: The key the listing was rendered for
+        text: The rendered listing
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob(f"{name}-*.txt"):
+            stale.unlink(missing_ok=True)
+        (CACHE_DIR / f"{name}-{key}.txt").write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+
+def _response_path(url: str, params: Dict[str, Any]) -> Path:
+    key = json.dumps([url, sorted(params.items())], default=str)
+    return CACHE_DIR / f"response-{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+def read_cached_response(url: str, params: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+    """
+    Read a previously saved API response.
+    
+    Args:
+        url: The URL the response was requested from
+        params: The query parameters of the request
+    
+    Returns:
+        Optional[Tuple[str, Any]]: The ETag and decoded body of the response, or None if there is
+        no saved copy
+    """
+    path = _response_path(url, params)
+    try:
+        cached = json.loads(path.read_text(encoding="utf-8"))
+        # A response that is still current is not written again, so it is marked as used here to
+        # keep it from being pruned.
+        path.touch()
+        return cached["etag"], cached["body"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_cached_response(url: str, params: Dict[str, Any], etag: str, body: Any) -> None:
+    """
+    Save an API response so it can be revalidated with its ETag.
+    
+    Only the most recently used responses are kept, so the cache doesn't grow as new resources and
+    queries are requested. Failing to write the cache is not an error; the resource will just be
+    requested in full next time.
+    
+    Args:
+        url: The URL the response was requested from
+        params: The query parameters of the request
+        etag: The ETag of the response
+        body: The decoded body of the response
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _response_path(url, params).write_text(json.dumps({"etag": etag, "body": body}), encoding="utf-8")
+        responses = sorted(CACHE_DIR.glob("response-*.json"), key=_modified_time, reverse=True)
+        for stale in responses[MAX_CACHED_RESPONSES:]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+def _modified_time(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def read_cached_pull_requests() -> Dict[str, Dict[str, Any]]:
+    """
+    Read the saved pull request details.
+    
+    Returns:
+        Dict[str, Dict[str, Any]]: The details of each saved pull request, keyed on its number
+    """
+    try:
+        return json.loads((CACHE_DIR / "pull-requests.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def write_cached_pull_requests(pull_requests: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Save pull request details, replacing those saved previously.
+    
+    Failing to write the cache is not an error; the pull requests will just be fetched again next
+    time.
+    
+    Args:
+        pull_requests: The details of each pull request, keyed on its number
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / "pull-requests.json").write_text(json.dumps(pull_requests), encoding="utf-8")
+    except OSError:
+        pass
@@ -1,42 +1,73 @@
-import requests
 import os
 import sys
-from datetime import datetime
 
-import questionary
-from rich import print as rprint
+from rich.console import Console
+from rich.text import Text
 
+from runner.cache import database_state, read_cached_listing, write_cached_listing
 from runner.db import ClientDeploymentRepository
-from runner.linear import (
-    Team,
-    IssueLabel,
-    create_issue,
-    create_project_update,
-    get_project_id,
-    get_projects,
-    get_issue_label_id,
-    get_state_id,
-)
 from runner.models import ClientDeployment, DeploymentType
-from runner.reporting import build_client_deployment_report
+from runner.reporting import build_client_deployment_report, parse_timestamp
 
 REPO_OWNER = "maidsafe"
 REPO_NAME = "sn-testnet-workflows"
 AUTONOMI_REPO_NAME = "autonomi"
 
+# Matches the console behind rich's print, so long report lines wrap the same way.
+_console = Console()
+
+_LIST_BANNER = "\n".join([
+    "=" * 61,
+    " " * 12 + "C L I E N T   D E P L O Y M E N T S" + " " * 12,
+    "=" * 61,
+]) + "\n"
+_LIST_HEADER = f"{'ID':<5} {'Name':<7} {'Deployed':<20} {'PR#':<15} {'Smoke Test':<10}\n" + "-" * 70
+_LIST_ROW_FORMAT = "{0.id:<5} [green]{0.name:<7}[/green] {0.triggered_at:<20} {1:<15} {2:<10}".format
+_DETAILS_RULE = Text("-" * 61)
+_LIST_RUN_URL_FORMAT = f"  https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{{0.run_id}}".format
+
 def ls(show_details: bool = False) -> None:
-    """List all recorded client deployments."""
+    """List all recorded client deployments.
+    
+    As with the network deployments listing, the rendered listing is cached until the database next
+    changes.
+    """
     try:
-        repo = ClientDeploymentRepository()
-        deployments = repo.list_client_deployments()
-        if not deployments:
+        mode = "details" if show_details else "compact"
+        listing_name = f"client-deployments-{mode}-{_console.color_system or 'plain'}-{_console.width}"
+        listing_key = database_state()
+        listing = read_cached_listing(listing_name, listing_key)
+        if listing is None:
+            listing = _render_client_deployments(show_details)
+            if listing:
+                write_cached_listing(listing_name, listing_key, listing)
+        if not listing:
             print("No client deployments found.")
             return
             
-        print("=" * 61)
-        print(" " * 12 + "C L I E N T   D E P L O Y M E N T S" + " " * 12)
-        print("=" * 61)
+        sys.stdout.write(_LIST_BANNER)
+        sys.stdout.write(listing)
+        print("\nAll times are in UTC")
+    except Exception as e:
+        print(f"Error: Failed to retrieve client deployments: {e}")
+        sys.exit(1)
+
+def _render_client_deployments(show_details: bool) -> str:
+    """
+    Render the client deployments listing.
+    
+    Args:
+        show_details: Whether to render the detailed listing rather than one row per deployment
+        
+    Returns:
+        str: The rendered listing, or an empty string if there are no client deployments
+    """
+    repo = ClientDeploymentRepository()
+    deployments = repo.list_client_deployments() if show_details else repo.list_client_deployment_rows()
+    if not deployments:
+        return ""
         
+    with _console.capture() as capture:
         if show_details:
             for deployment in deployments:
                 lines = []
@@ -45,30 +76,24 @@ def ls(show_details: bool = False) -> None:
                 if deployment.description:
                     lines.append(f"Description: {deployment.description}")
                 lines.extend(build_client_deployment_report(deployment))
-                rprint("\n".join(lines))
-                print("-" * 61)
+                _console.print("\n".join(lines), _DETAILS_RULE, sep="\n")
         else:
-            print(f"{'ID':<5} {'Name':<7} {'Deployed':<20} {'PR#':<15} {'Smoke Test':<10}")
-            print("-" * 70)
+            _console.print(Text(_LIST_HEADER))
             
+            smoke_tests = repo.get_smoke_test_results()
             for deployment in deployments:
                 related_pr = f"#{deployment.related_pr}" if deployment.related_pr else "-"
-                timestamp = deployment.triggered_at.strftime("%Y-%m-%d %H:%M:%S")
 
-                smoke_test = repo.get_smoke_test_result(deployment.id)
+                smoke_test = smoke_tests.get(deployment.id)
                 if not smoke_test:
                     smoke_status = "-"
                 else:
-                    has_failures = any(answer == "No" for answer in smoke_test.results.values())
+                    has_failures = any(answer == "No" for answer in smoke_test.values())
                     smoke_status = "[red]✗[/red]" if has_failures else "[green]✓[/green]"
                 
-                rprint(f"{deployment.id:<5} [green]{deployment.name:<7}[/green] {timestamp:<20} {related_pr:<15} {smoke_status:<10}")
-                print(f"  https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{deployment.run_id}")
-                
-        print("\nAll times are in UTC")
-    except Exception as e:
-        print(f"Error: Failed to retrieve client deployments: {e}")
-        sys.exit(1)
+                _console.print(_LIST_ROW_FORMAT(deployment, related_pr, smoke_status))
+                _console.print(Text(_LIST_RUN_URL_FORMAT(deployment)))
+    return capture.get()
 
 def print_deployment(deployment_id: int) -> None:
     """Print detailed information about a specific deployment.
@@ -91,6 +116,7 @@ def post(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to post
     """
+    import requests
     webhook_url = os.getenv("ANT_RUNNER_ENVIRONMENTS_WEBHOOK_URL")
     if not webhook_url:
         print("Error: ANT_RUNNER_ENVIRONMENTS_WEBHOOK_URL environment variable is not set")
@@ -121,6 +147,8 @@ def smoke_test(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to test
     """
+    # Imported here because prompt_toolkit is slow to load and the listing commands don't need it.
+    import questionary
     repo = ClientDeploymentRepository()
     deployment = repo.get_by_id(deployment_id)
     if not deployment:
@@ -176,6 +204,7 @@ def upload_report(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to upload report for
     """
+    import questionary
     try:
         repo = ClientDeploymentRepository()
         deployment = repo.get_by_id(deployment_id)
@@ -214,8 +243,8 @@ def upload_report(deployment_id: int) -> None:
             validate=lambda text: text.replace('.', '').isdigit()
         ).ask()
 
-        start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_datetime = parse_timestamp(start_time)
+        end_datetime = parse_timestamp(end_time)
         duration_seconds = (end_datetime - start_datetime).total_seconds()
         duration_hours = duration_seconds / 3600
 
@@ -243,6 +272,7 @@ def download_report(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the client deployment to generate download report for
     """
+    import questionary
     try:
         repo = ClientDeploymentRepository()
         deployment = repo.get_by_id(deployment_id)
@@ -252,8 +282,8 @@ def download_report(deployment_id: int) -> None:
         start_time = questionary.text("Start time:").ask()
         end_time = questionary.text("End time:").ask()
         
-        start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_datetime = parse_timestamp(start_time)
+        end_datetime = parse_timestamp(end_time)
         duration_seconds = (end_datetime - start_datetime).total_seconds()
         duration_hours = duration_seconds / 3600
         
@@ -369,6 +399,18 @@ def linear(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the client deployment to create an issue for
     """
+    import questionary
+    # Imported here so that the listing commands don't load requests through the Linear client.
+    from runner.linear import (
+        Team,
+        IssueLabel,
+        create_issue,
+        create_project_update,
+        get_project_id,
+        get_projects,
+        get_issue_label_id,
+        get_state_id,
+    )
     try:
         repo = ClientDeploymentRepository()
         deployment = repo.get_by_id(deployment_id)
@@ -1,11 +1,10 @@
 import os
-import requests
 import sys
 
 from datetime import datetime, UTC
+from itertools import chain, islice
 
-import questionary
-from rich import print as rprint
+from rich.console import Console
 
 from runner.db import (
     ClientDeploymentRepository,
@@ -15,16 +14,6 @@ from runner.db import (
     ComparisonUploadResultRepository,
     NetworkDeploymentRepository,
 )
-from runner.linear import (
-    Team,
-    IssueLabel,
-    create_issue,
-    create_project_update,
-    get_project_id,
-    get_projects,
-    get_issue_label_id,
-    get_state_id,
-)
 from runner.models import (
     ComparisonDownloadResult,
     ComparisonResult,
@@ -34,12 +23,38 @@ from runner.models import (
 from runner.reporting import (
     build_comparison_report,
     build_comparison_smoke_test_report,
+    format_timestamp,
+    parse_timestamp,
 )
 
 REPO_OWNER = "maidsafe"
 REPO_NAME = "sn-testnet-workflows"
 AUTONOMI_REPO_NAME = "autonomi"
 
+# Matches the console behind rich's print, so rows render as they did when printed one at a time.
+_console = Console()
+
+_LIST_BANNER = "\n".join([
+    "=" * 100,
+    " " * 35 + "C O M P A R I S O N S" + " " * 35,
+    "=" * 100,
+]) + "\n"
+_RESULTS_BANNER = "\n".join(["=" * 19, "COMPARISON RESULTS", "=" * 19])
+_LIST_HEADER = f"{'ID':<5} {'Title':<50} {'Created':<20} {'Type':<10}\n" + "-" * 100 + "\n"
+
+def _format_heading(text: str) -> str:
+    """
+    Format a heading for a results summary, underlined and overlined to the width of the text.
+    
+    Args:
+        text: The heading text
+        
+    Returns:
+        str: The heading, preceded by a blank line
+    """
+    rule = "=" * len(text)
+    return f"\n{rule}\n{text}\n{rule}"
+
 def add_thread(comparison_id: int, thread_link: str) -> None:
     """Add or update the thread link for a comparison.
     
@@ -57,26 +72,28 @@ def add_thread(comparison_id: int, thread_link: str) -> None:
 def ls() -> None:
     """List all recorded comparisons."""
     repo = ComparisonRepository()
-    comparisons = repo.list_comparisons()
-    if not comparisons:
+    comparisons = repo.iter_comparisons()
+    first_comparison = next(comparisons, None)
+    if first_comparison is None:
         print("No comparisons found.")
         return
         
-    print("=" * 100)
-    print(" " * 35 + "C O M P A R I S O N S" + " " * 35)
-    print("=" * 100)
+    sys.stdout.write(_LIST_BANNER)
+    sys.stdout.write(_LIST_HEADER)
     
-    print(f"{'ID':<5} {'Title':<50} {'Created':<20} {'Type':<10}")
-    print("-" * 100)
-    
-    for comparison in comparisons:
-        created_at = comparison.created_at.strftime("%Y-%m-%d %H:%M:%S")
-        rprint(f"{comparison.id:<5} {comparison.title:<50} {created_at:<20} {comparison.deployment_type:<10}")
+    rows = (
+        f"{comparison.id:<5} {comparison.title:<50} {format_timestamp(comparison.created_at):<20} {comparison.deployment_type:<10}"
+        for comparison in chain([first_comparison], comparisons)
+    )
+    while batch := list(islice(rows, 100)):
+        _console.print("\n".join(batch))
         
     print("\nAll times are in UTC")
 
 def new(deployment_type: str = "network") -> None:
     """Create a new comparison using interactive prompts."""
+    # Imported here because prompt_toolkit is slow to load and the listing commands don't need it.
+    import questionary
 
     dep_type = DeploymentType.NETWORK if deployment_type == "network" else DeploymentType.CLIENT
     if dep_type == DeploymentType.NETWORK:
@@ -93,7 +110,7 @@ def new(deployment_type: str = "network") -> None:
         return
 
     choices = [
-        f"{d.name} ({d.created_at.strftime('%Y-%m-%d %H:%M:%S')})"
+        f"{d.name} ({format_timestamp(d.created_at)})"
         for d in recent_deployments
     ]
 
@@ -153,6 +170,7 @@ def post(comparison_id: int) -> None:
     Args:
         comparison_id: ID of the comparison to post
     """
+    import requests
     webhook_url = os.getenv("ANT_RUNNER_ENVIRONMENTS_WEBHOOK_URL")
     if not webhook_url:
         print("Error: ANT_RUNNER_ENVIRONMENTS_WEBHOOK_URL environment variable is not set")
@@ -167,32 +185,33 @@ def post(comparison_id: int) -> None:
         report = build_comparison_report(comparison)
         smoke_test_report = build_comparison_smoke_test_report(comparison)
         
-        if comparison.deployment_type == DeploymentType.NETWORK:
-            response = requests.post(
-                webhook_url,
-                json={"text": report},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            print(f"Posted comparison report to Slack")
-
-            response = requests.post(
-                webhook_url,
-                json={"text": smoke_test_report},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            print(f"Posted smoke test report to Slack")
-        elif comparison.deployment_type == DeploymentType.CLIENT:
-            response = requests.post(
-                webhook_url,
-                json={"text": report + "\n\n" + smoke_test_report},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
-            print(f"Posted comparison report to Slack")
-        else:
-            print(f"Skipping smoke test report for client deployment")
+        with requests.Session() as session:
+            if comparison.deployment_type == DeploymentType.NETWORK:
+                response = session.post(
+                    webhook_url,
+                    json={"text": report},
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                print(f"Posted comparison report to Slack")
+
+                response = session.post(
+                    webhook_url,
+                    json={"text": smoke_test_report},
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                print(f"Posted smoke test report to Slack")
+            elif comparison.deployment_type == DeploymentType.CLIENT:
+                response = session.post(
+                    webhook_url,
+                    json={"text": report + "\n\n" + smoke_test_report},
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                print(f"Posted comparison report to Slack")
+            else:
+                print(f"Skipping smoke test report for client deployment")
     except requests.exceptions.RequestException as e:
         print(f"Error posting to Slack: {e}")
         sys.exit(1)
@@ -201,7 +220,7 @@ def print_comparison(comparison_id: int) -> None:
     """Print detailed information about a specific comparison."""
     try:
         repo = ComparisonRepository()
-        comparison = repo.get_by_id(comparison_id)
+        comparison = repo.get_with_deployments(comparison_id)
         if not comparison:
             raise ValueError(f"Comparison with ID {comparison_id} not found")
         report = build_comparison_report(comparison)
@@ -213,6 +232,7 @@ def print_comparison(comparison_id: int) -> None:
         sys.exit(1)
 
 def record_results(comparison_id: int, generic_nodes_report_path: str = None, full_cone_nat_nodes_report_path: str = None, symmetric_nat_nodes_report_path: str = None) -> None:
+    import questionary
     repo = ComparisonRepository()
     comparison = repo.get_by_id(comparison_id)
     if not comparison:
@@ -225,8 +245,8 @@ def record_results(comparison_id: int, generic_nodes_report_path: str = None, fu
         if not report_output_path or not os.path.exists(report_output_path):
             raise ValueError("ANT_COMP_REPORT_OUTPUT_PATH environment variable is not set, empty, or refers to a path that does not exist")
         generic_report_path = os.path.join(report_output_path, "GENERIC_NODE.html")
-        if not os.path.exists(generic_report_path):
-            raise ValueError(f"Generic nodes report file not found at {generic_report_path}")
+    if not os.path.exists(generic_report_path):
+        raise ValueError(f"Generic nodes report file not found at {generic_report_path}")
     
     if full_cone_nat_nodes_report_path:
         full_cone_report_path = full_cone_nat_nodes_report_path
@@ -235,8 +255,8 @@ def record_results(comparison_id: int, generic_nodes_report_path: str = None, fu
         if not report_output_path or not os.path.exists(report_output_path):
             raise ValueError("ANT_COMP_REPORT_OUTPUT_PATH environment variable is not set, empty, or refers to a path that does not exist")
         full_cone_report_path = os.path.join(report_output_path, "NAT_STATIC_FULL_CONE_NODE.html")
-        if not os.path.exists(full_cone_report_path):
-            raise ValueError(f"Full cone NAT nodes report file not found at {full_cone_report_path}")
+    if not os.path.exists(full_cone_report_path):
+        raise ValueError(f"Full cone NAT nodes report file not found at {full_cone_report_path}")
     
     if symmetric_nat_nodes_report_path:
         symmetric_report_path = symmetric_nat_nodes_report_path
@@ -245,28 +265,19 @@ def record_results(comparison_id: int, generic_nodes_report_path: str = None, fu
         if not report_output_path or not os.path.exists(report_output_path):
             raise ValueError("ANT_COMP_REPORT_OUTPUT_PATH environment variable is not set, empty, or refers to a path that does not exist")
         symmetric_report_path = os.path.join(report_output_path, "NAT_RANDOMIZED_NODE.html")
-        if not os.path.exists(symmetric_report_path):
-            raise ValueError(f"Symmetric NAT nodes report file not found at {symmetric_report_path}")
-    
-    with open(generic_report_path, 'r') as f:
-        generic_nodes_report = f.read()
-    
-    with open(full_cone_report_path, 'r') as f:
-        full_cone_nat_nodes_report = f.read()
+    if not os.path.exists(symmetric_report_path):
+        raise ValueError(f"Symmetric NAT nodes report file not found at {symmetric_report_path}")
     
-    with open(symmetric_report_path, 'r') as f:
-        symmetric_nat_nodes_report = f.read()
-
     started_at = questionary.text("Start time:").ask()
     try:
-        started_at = datetime.strptime(started_at, "%Y-%m-%d %H:%M:%S")
+        started_at = parse_timestamp(started_at)
     except ValueError:
         print(f"Error: Start time '{started_at}' is not in the correct format. Please use YYYY-MM-DD HH:MM:SS")
         sys.exit(1)
     
     ended_at = questionary.text("End time:").ask()
     try:
-        ended_at = datetime.strptime(ended_at, "%Y-%m-%d %H:%M:%S")
+        ended_at = parse_timestamp(ended_at)
     except ValueError:
         print(f"Error: End time '{ended_at}' is not in the correct format. Please use YYYY-MM-DD HH:MM:SS")
         sys.exit(1)
@@ -296,6 +307,17 @@ def record_results(comparison_id: int, generic_nodes_report_path: str = None, fu
         print("Error: a description must be provided")
         sys.exit(1)
 
+    # The reports can run to several megabytes each, so rather than holding them in memory while
+    # waiting on the prompts, they are only read once everything else has been entered.
+    with open(generic_report_path, 'r') as f:
+        generic_nodes_report = f.read()
+    
+    with open(full_cone_report_path, 'r') as f:
+        full_cone_nat_nodes_report = f.read()
+    
+    with open(symmetric_report_path, 'r') as f:
+        symmetric_nat_nodes_report = f.read()
+
     repo = ComparisonResultRepository()
     result = ComparisonResult(
         comparison_id=comparison_id,
@@ -322,6 +344,7 @@ def record_upload_results(comparison_id: int) -> None:
     Args:
         comparison_id: ID of the comparison to upload report for
     """
+    import questionary
     try:
         repo = ComparisonRepository()
         comparison = repo.get_by_id(comparison_id)
@@ -334,8 +357,8 @@ def record_upload_results(comparison_id: int) -> None:
         start_time = questionary.text("Start time:").ask()
         end_time = questionary.text("End time:").ask()
         
-        start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_datetime = parse_timestamp(start_time)
+        end_datetime = parse_timestamp(end_time)
         duration_seconds = (end_datetime - start_datetime).total_seconds()
         duration_hours = duration_seconds / 3600
         
@@ -450,6 +473,7 @@ def print_results(comparison_id: int) -> None:
     Args:
         comparison_id: ID of the comparison to display results for
     """
+    lines = []
     try:
         comparison_repo = ComparisonRepository()
         comparison = comparison_repo.get_by_id(comparison_id)
@@ -460,18 +484,16 @@ def print_results(comparison_id: int) -> None:
         comparison_result = result_repo.get_results(comparison_id)
         
         if comparison_result:
-            print("=" * 19)
-            print("COMPARISON RESULTS")
-            print("=" * 19)
-            print(f"Results recorded at: {comparison_result.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Time period: {comparison_result.started_at.strftime('%Y-%m-%d %H:%M:%S')} to {comparison_result.ended_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(_RESULTS_BANNER)
+            lines.append(f"Results recorded at: {comparison_result.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Time period: {comparison_result.started_at.strftime('%Y-%m-%d %H:%M:%S')} to {comparison_result.ended_at.strftime('%Y-%m-%d %H:%M:%S')}")
             duration_seconds = (comparison_result.ended_at - comparison_result.started_at).total_seconds()
             duration_hours = duration_seconds / 3600
-            print(f"Duration: {duration_hours:.2f} hours")
-            print()
-            print(f"{comparison_result.description}")
+            lines.append(f"Duration: {duration_hours:.2f} hours")
+            lines.append("")
+            lines.append(f"{comparison_result.description}")
         else:
-            print("No detailed comparison results found for this comparison.")
+            lines.append("No detailed comparison results found for this comparison.")
         
         upload_result_repo = ComparisonUploadResultRepository()
         
@@ -523,12 +545,9 @@ def print_results(comparison_id: int) -> None:
             ref_env_part = f"{ref_result['deployment_name']} [{ref_result['env_name']}]"
             header_text = f"UPLOADS: {' vs '.join(test_env_parts)} vs {ref_env_part}"
             
-            print()
-            print("=" * len(header_text))
-            print(header_text)
-            print("=" * len(header_text))
-            print(f"Time slice: {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Duration: {duration_hours:.2f} hours")
+            lines.append(_format_heading(header_text))
+            lines.append(f"Time slice: {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Duration: {duration_hours:.2f} hours")
             
             metrics = [
                 ("Uploaders", "total_uploaders", ""),
@@ -542,14 +561,14 @@ def print_results(comparison_id: int) -> None:
                 ("Other errors", "other_error_count", "")
             ]
             
-            print()
+            lines.append("")
             max_metric_width = max(len(metric_name) for metric_name, _, _ in metrics)
             for metric_name, metric_key, unit in metrics:
                 ref_value = ref_result[metric_key]
                 test_values = [str(result[metric_key]) for result in test_results]
                 comparison = " vs ".join(test_values + [str(ref_value)])
                 padding = " " * (max_metric_width - len(metric_name))
-                print(f"{metric_name}:{padding} {comparison}{unit}")
+                lines.append(f"{metric_name}:{padding} {comparison}{unit}")
         
         download_result_repo = ComparisonDownloadResultRepository()
         download_results = None
@@ -599,12 +618,9 @@ def print_results(comparison_id: int) -> None:
             ref_env_part = f"{ref_result['deployment_name']} [{ref_result['env_name']}]"
             header_text = f"DOWNLOADS: {' vs '.join(test_env_parts)} vs {ref_env_part}"
             
-            print()
-            print("=" * len(header_text))
-            print(header_text)
-            print("=" * len(header_text))
-            print(f"Time slice: {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"Duration: {duration_hours:.2f} hours")
+            lines.append(_format_heading(header_text))
+            lines.append(f"Time slice: {start_time.strftime('%Y-%m-%d %H:%M:%S')} to {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Duration: {duration_hours:.2f} hours")
             
             verifier_types = [
                 ("Delayed Verifier", "standard"),
@@ -612,9 +628,9 @@ def print_results(comparison_id: int) -> None:
                 ("Performance Verifier", "perf")
             ]
             
-            print()
+            lines.append("")
             for verifier_name, prefix in verifier_types:
-                print(f"{verifier_name}:")
+                lines.append(f"{verifier_name}:")
                 
                 metrics = [
                     ("Successful downloads", f"{prefix}_successful", ""),
@@ -626,10 +642,14 @@ def print_results(comparison_id: int) -> None:
                     ref_value = ref_result[metric_key]
                     test_values = [str(result[metric_key]) for result in test_results]
                     comparison = " vs ".join(test_values + [str(ref_value)])
-                    print(f"  - {metric_name}: {comparison}{unit}")
+                    lines.append(f"  - {metric_name}: {comparison}{unit}")
         
         if not has_results:
-            print("\nNo upload or download results found for this comparison.")
+            lines.append("\nNo upload or download results found for this comparison.")
+        
+        # Written in one go rather than a line at a time, since results for several environments
+        # can run to many lines.
+        sys.stdout.write("\n".join(lines) + "\n")
     except Exception as e:
         print(f"Error displaying results: {e}")
         sys.exit(1)
@@ -640,6 +660,7 @@ def record_download_results(comparison_id: int) -> None:
     Args:
         comparison_id: ID of the comparison to generate download report for
     """
+    import questionary
     try:
         repo = ComparisonRepository()
         comparison = repo.get_by_id(comparison_id)
@@ -652,8 +673,8 @@ def record_download_results(comparison_id: int) -> None:
         start_time = questionary.text("Start time:").ask()
         end_time = questionary.text("End time:").ask()
         
-        start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_datetime = parse_timestamp(start_time)
+        end_datetime = parse_timestamp(end_time)
         duration_seconds = (end_datetime - start_datetime).total_seconds()
         duration_hours = duration_seconds / 3600
         
@@ -776,6 +797,18 @@ def linear(comparison_id: int) -> None:
     Args:
         comparison_id: ID of the comparison to create an issue for
     """
+    import questionary
+    # Imported here so that the listing commands don't load requests through the Linear client.
+    from runner.linear import (
+        Team,
+        IssueLabel,
+        create_issue,
+        create_project_update,
+        get_project_id,
+        get_projects,
+        get_issue_label_id,
+        get_state_id,
+    )
     try:
         repo = ComparisonRepository()
         comparison = repo.get_by_id(comparison_id)
@@ -1,41 +1,94 @@
 import os
-import requests
 import sys
-from datetime import datetime
-
-import questionary
-from rich import print as rprint
-
-from runner.cmd.workflows import (
-    launch_network,
-    start_downloaders,
-    start_uploaders,
-    stop_downloaders,
-    stop_uploaders
-)
+
+from rich.console import Console
+from rich.text import Text
+
+from runner.cache import database_state, read_cached_listing, write_cached_listing
 from runner.db import NetworkDeploymentRepository
-from runner.linear import (
-    Team,
-    IssueLabel,
-    create_issue,
-    create_project_update,
-    get_projects,
-    get_issue_label_id,
-    get_state_id
-)
 from runner.models import NetworkDeployment
-from runner.reporting import build_deployment_report
+from runner.reporting import EVM_TYPE_DISPLAY, build_deployment_report, format_timestamp, parse_timestamp
 
 REPO_OWNER = "maidsafe"
 REPO_NAME = "sn-testnet-workflows"
 AUTONOMI_REPO_NAME = "autonomi"
 
+_console = Console(soft_wrap=True)
+
+_LIST_BANNER = "\n".join([
+    "=" * 61,
+    " " * 18 + "D E P L O Y M E N T S" + " " * 18,
+    "=" * 61,
+]) + "\n"
+
+_LIST_HEADER = f"{'ID':<5} {'Name':<7} {'Deployed':<20} {'PR#':<15} {'Smoke Test':<10}\n" + "-" * 70
+_LIST_ROW_FORMAT = "{0.id:<5} [green]{0.name:<7}[/green] {0.triggered_at:<20} {1:<15} {2:<10}".format
+_LIST_RUN_URL_FORMAT = f"  https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{{0.run_id}}".format
+
+# Sections of the detailed listing; each is formatted in one pass from the deployment's attributes.
+_DETAILS_TITLE_FORMAT = "Name: [green]{0.name}[/green]".format
+_DETAILS_ID_FORMAT = "ID: {0.id}\nDeployed: {1}".format
+_DETAILS_DESCRIPTION_FORMAT = "Description: {0.description}".format
+_DETAILS_RUN_FORMAT = (
+    "EVM Type: {1}\n"
+    f"Workflow run: https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{{0.run_id}}"
+).format
+_DETAILS_PR_FORMAT = (
+    "Related PR: #{0.related_pr}\n"
+    f"Link: https://github.com/{REPO_OWNER}/{AUTONOMI_REPO_NAME}/pull/{{0.related_pr}}"
+).format
+_DETAILS_VERSIONS_FORMAT = (
+    "===============\n"
+    "Version Details\n"
+    "===============\n"
+    "Ant: {0.ant_version}\n"
+    "Antnode: {0.antnode_version}\n"
+    "Antctl: {0.antctl_version}"
+).format
+_DETAILS_BRANCH_FORMAT = (
+    "=====================\n"
+    "Custom Branch Details\n"
+    "=====================\n"
+    "Branch: {0.branch}\n"
+    "Repo Owner: {0.repo_owner}\n"
+    f"Link: https://github.com/{{0.repo_owner}}/{AUTONOMI_REPO_NAME}/tree/{{0.branch}}"
+).format
+_DETAILS_CHUNK_SIZE_FORMAT = "Chunk Size: {0.chunk_size}".format
+_DETAILS_FEATURES_FORMAT = "Antnode Features: {0.antnode_features}".format
+_DETAILS_NODES_FORMAT = (
+    "==================\n"
+    "Node Configuration\n"
+    "==================\n"
+    "Peer cache nodes: {0.peer_cache_vm_count}x{0.peer_cache_node_count} [{0.peer_cache_node_vm_size}]\n"
+    "Generic nodes: {0.generic_vm_count}x{0.generic_node_count} [{0.generic_node_vm_size}]\n"
+    "Full cone private nodes: {0.full_cone_private_vm_count}x{0.full_cone_private_node_count} [{0.generic_node_vm_size}]\n"
+    "Symmetric private nodes: {0.symmetric_private_vm_count}x{0.symmetric_private_node_count} [{0.generic_node_vm_size}]\n"
+    "Total: {0.total_nodes}"
+).format
+_DETAILS_CLIENTS_FORMAT = (
+    "====================\n"
+    "Client Configuration\n"
+    "====================\n"
+    "{0.client_vm_count}x{0.uploader_count} [{0.client_vm_size}]\n"
+    "Total: {0.total_uploaders}"
+).format
+_DETAILS_MISC_HEADER = "==================\nMisc Configuration\n=================="
+_DETAILS_MAX_LOG_FILES_FORMAT = "Max log files: {0.max_log_files}".format
+_DETAILS_MAX_ARCHIVED_LOG_FILES_FORMAT = "Max archived log files: {0.max_archived_log_files}".format
+_DETAILS_EVM_HEADER = "=================\nEVM Configuration\n================="
+_DETAILS_RULE = "-" * 61
+_DETAILS_DATA_PAYMENTS_FORMAT = "Data Payments Address: {0.evm_data_payments_address}".format
+_DETAILS_PAYMENT_TOKEN_FORMAT = "Payment Token Address: {0.evm_payment_token_address}".format
+_DETAILS_RPC_URL_FORMAT = "RPC URL: {0.evm_rpc_url}".format
+
 def dev(network_name: str) -> None:
     """Launch a development network with preset configuration.
     
     Args:
         network_name: Name of the development environment (e.g. DEV-01)
     """
+    # Imported here so that listing deployments doesn't load the workflow dispatch machinery.
+    from runner.cmd.workflows import launch_network
     if not network_name.startswith("DEV-"):
         print("Error: Network name must start with 'DEV-'")
         sys.exit(1)
@@ -61,134 +114,116 @@ def dev(network_name: str) -> None:
     launch_network(config, "main", force=False, wait=False)
 
 def ls(show_details: bool = False) -> None:
-    """List all recorded deployments."""
+    """List all recorded deployments.
+    
+    The rendered listing is cached until the database next changes, so repeated calls do not need
+    to query and format every deployment again.
+    """
     try:
-        repo = NetworkDeploymentRepository()
-        deployments = repo.list_deployments()
-        if not deployments:
+        mode = "details" if show_details else "compact"
+        listing_name = f"deployments-{mode}-{_console.color_system or 'plain'}"
+        listing_key = database_state()
+        listing = read_cached_listing(listing_name, listing_key)
+        if listing is None:
+            listing = _render_deployments(show_details)
+            if listing:
+                write_cached_listing(listing_name, listing_key, listing)
+        if not listing:
             print("No deployments found.")
             return
             
-        print("=" * 61)
-        print(" " * 18 + "D E P L O Y M E N T S" + " " * 18)
-        print("=" * 61)
-        
-        if show_details:
-            for deployment in deployments:
-                timestamp = deployment.triggered_at.strftime("%Y-%m-%d %H:%M:%S")
-                rprint(f"Name: [green]{deployment.name}[/green]")
-                print(f"ID: {deployment.id}")
-                print(f"Deployed: {timestamp}")
-                if deployment.description:
-                    print(f"Description: {deployment.description}")
-                evm_type_display = {
-                    "anvil": "Anvil",
-                    "arbitrum-one": "Arbitrum One",
-                    "arbitrum-sepolia": "Arbitrum Sepolia", 
-                    "custom": "Custom"
-                }.get(deployment.evm_network_type, deployment.evm_network_type)
-                print(f"EVM Type: {evm_type_display}")
-                print(f"Workflow run: https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{deployment.run_id}")
-                if deployment.related_pr:
-                    print(f"Related PR: #{deployment.related_pr}")
-                    print(f"Link: https://github.com/{REPO_OWNER}/{AUTONOMI_REPO_NAME}/pull/{deployment.related_pr}")
-
-                if deployment.ant_version:
-                    print(f"===============")
-                    print(f"Version Details")
-                    print(f"===============")
-                    print(f"Ant: {deployment.ant_version}")
-                    print(f"Antnode: {deployment.antnode_version}")
-                    print(f"Antctl: {deployment.antctl_version}")
-
-                if deployment.branch:
-                    print(f"=====================")
-                    print(f"Custom Branch Details")
-                    print(f"=====================")
-                    print(f"Branch: {deployment.branch}")
-                    print(f"Repo Owner: {deployment.repo_owner}")
-                    print(f"Link: https://github.com/{deployment.repo_owner}/{AUTONOMI_REPO_NAME}/tree/{deployment.branch}")
-                    if deployment.chunk_size:
-                        print(f"Chunk Size: {deployment.chunk_size}")
-                    if deployment.antnode_features:
-                        print(f"Antnode Features: {deployment.antnode_features}")
-
-                print(f"==================")
-                print(f"Node Configuration")
-                print(f"==================")
-                print(f"Peer cache nodes: {deployment.peer_cache_vm_count}x{deployment.peer_cache_node_count} [{deployment.peer_cache_node_vm_size}]")
-                print(f"Generic nodes: {deployment.generic_vm_count}x{deployment.generic_node_count} [{deployment.generic_node_vm_size}]")
-                print(f"Full cone private nodes: {deployment.full_cone_private_vm_count}x{deployment.full_cone_private_node_count} [{deployment.generic_node_vm_size}]")
-                print(f"Symmetric private nodes: {deployment.symmetric_private_vm_count}x{deployment.symmetric_private_node_count} [{deployment.generic_node_vm_size}]")
-                total_nodes = deployment.generic_vm_count * deployment.generic_node_count
-                if deployment.peer_cache_vm_count and deployment.peer_cache_node_count:
-                    total_nodes += deployment.peer_cache_vm_count * deployment.peer_cache_node_count
-                if deployment.full_cone_private_vm_count and deployment.full_cone_private_node_count:
-                    total_nodes += deployment.full_cone_private_vm_count * deployment.full_cone_private_node_count
-                if deployment.symmetric_private_vm_count and deployment.symmetric_private_node_count:
-                    total_nodes += deployment.symmetric_private_vm_count * deployment.symmetric_private_node_count
-                print(f"Total: {total_nodes}")
-
-                if deployment.client_vm_count and deployment.uploader_count and deployment.client_vm_size:
-                    print(f"====================")
-                    print(f"Client Configuration")
-                    print(f"====================")
-                    print(f"{deployment.client_vm_count}x{deployment.uploader_count} [{deployment.client_vm_size}]")
-                    total_uploaders = deployment.client_vm_count * deployment.uploader_count
-                    print(f"Total: {total_uploaders}")
-
-                if deployment.max_log_files or deployment.max_archived_log_files:
-                    print(f"==================")
-                    print(f"Misc Configuration")
-                    print(f"==================")
-                    if deployment.max_log_files:
-                        print(f"Max log files: {deployment.max_log_files}")
-                    if deployment.max_archived_log_files:
-                        print(f"Max archived log files: {deployment.max_archived_log_files}")
-                    
-                if any([deployment.evm_data_payments_address, 
-                       deployment.evm_payment_token_address, 
-                       deployment.evm_rpc_url]):
-                    print(f"=================")
-                    print(f"EVM Configuration")
-                    print(f"=================")
-                    if deployment.evm_data_payments_address:
-                        print(f"Data Payments Address: {deployment.evm_data_payments_address}")
-                    if deployment.evm_payment_token_address:
-                        print(f"Payment Token Address: {deployment.evm_payment_token_address}")
-                    if deployment.evm_rpc_url:
-                        print(f"RPC URL: {deployment.evm_rpc_url}")
-
-                print("-" * 61)
-        else:
-            print(f"{'ID':<5} {'Name':<7} {'Deployed':<20} {'PR#':<15} {'Smoke Test':<10}")
-            print("-" * 70)
-            
-            for deployment in deployments:
-                related_pr = f"#{deployment.related_pr}" if deployment.related_pr else "-"
-                timestamp = deployment.triggered_at.strftime("%Y-%m-%d %H:%M:%S")
-                
-                smoke_test = repo.get_smoke_test_result(deployment.id)
-                if not smoke_test:
-                    smoke_status = "-"
-                else:
-                    has_failures = any(answer == "No" for answer in smoke_test.results.values())
-                    smoke_status = "[red]✗[/red]" if has_failures else "[green]✓[/green]"
-                
-                rprint(f"{deployment.id:<5} [green]{deployment.name:<7}[/green] {timestamp:<20} {related_pr:<15} {smoke_status:<10}")
-                print(f"  https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{deployment.run_id}")
-                
+        sys.stdout.write(_LIST_BANNER)
+        sys.stdout.write(listing)
         print("\nAll times are in UTC")
     except Exception as e:
         print(f"Error: Failed to retrieve deployments: {e}")
         sys.exit(1)
 
+def _render_deployments(show_details: bool) -> str:
+    """
+    Render the deployments listing.
+    
+    Args:
+        show_details: Whether to render the detailed listing rather than one row per deployment
+        
+    Returns:
+        str: The rendered listing, or an empty string if there are no deployments
+    """
+    repo = NetworkDeploymentRepository()
+    deployments = repo.list_deployments() if show_details else repo.list_deployment_rows()
+    if not deployments:
+        return ""
+        
+    blocks = []
+    if show_details:
+        for deployment in deployments:
+            evm_type_display = EVM_TYPE_DISPLAY.get(deployment.evm_network_type, deployment.evm_network_type)
+
+            lines = [_DETAILS_ID_FORMAT(deployment, format_timestamp(deployment.triggered_at))]
+            if deployment.description:
+                lines.append(_DETAILS_DESCRIPTION_FORMAT(deployment))
+            lines.append(_DETAILS_RUN_FORMAT(deployment, evm_type_display))
+            if deployment.related_pr:
+                lines.append(_DETAILS_PR_FORMAT(deployment))
+            if deployment.ant_version:
+                lines.append(_DETAILS_VERSIONS_FORMAT(deployment))
+            if deployment.branch:
+                lines.append(_DETAILS_BRANCH_FORMAT(deployment))
+                if deployment.chunk_size:
+                    lines.append(_DETAILS_CHUNK_SIZE_FORMAT(deployment))
+                if deployment.antnode_features:
+                    lines.append(_DETAILS_FEATURES_FORMAT(deployment))
+            lines.append(_DETAILS_NODES_FORMAT(deployment))
+            if deployment.client_vm_count and deployment.uploader_count and deployment.client_vm_size:
+                lines.append(_DETAILS_CLIENTS_FORMAT(deployment))
+            if deployment.max_log_files or deployment.max_archived_log_files:
+                lines.append(_DETAILS_MISC_HEADER)
+                if deployment.max_log_files:
+                    lines.append(_DETAILS_MAX_LOG_FILES_FORMAT(deployment))
+                if deployment.max_archived_log_files:
+                    lines.append(_DETAILS_MAX_ARCHIVED_LOG_FILES_FORMAT(deployment))
+            if (deployment.evm_data_payments_address or
+                    deployment.evm_payment_token_address or
+                    deployment.evm_rpc_url):
+                lines.append(_DETAILS_EVM_HEADER)
+                if deployment.evm_data_payments_address:
+                    lines.append(_DETAILS_DATA_PAYMENTS_FORMAT(deployment))
+                if deployment.evm_payment_token_address:
+                    lines.append(_DETAILS_PAYMENT_TOKEN_FORMAT(deployment))
+                if deployment.evm_rpc_url:
+                    lines.append(_DETAILS_RPC_URL_FORMAT(deployment))
+            lines.append(_DETAILS_RULE)
+
+            blocks.append(_console.render_str(_DETAILS_TITLE_FORMAT(deployment)))
+            blocks.append(Text("\n".join(lines)))
+    else:
+        blocks.append(Text(_LIST_HEADER))
+        
+        smoke_tests = repo.get_smoke_test_results()
+        for deployment in deployments:
+            related_pr = f"#{deployment.related_pr}" if deployment.related_pr else "-"
+            
+            smoke_test = smoke_tests.get(deployment.id)
+            if not smoke_test:
+                smoke_status = "-"
+            else:
+                has_failures = any(answer == "No" for answer in smoke_test.values())
+                smoke_status = "[red]✗[/red]" if has_failures else "[green]✓[/green]"
+            
+            blocks.append(_console.render_str(_LIST_ROW_FORMAT(deployment, related_pr, smoke_status)))
+            blocks.append(Text(_LIST_RUN_URL_FORMAT(deployment)))
+            
+    with _console.capture() as capture:
+        _console.print(Text("\n").join(blocks))
+    return capture.get()
+
 def post(deployment_id: int) -> None:
     """Post deployment information to Slack.
     
     Args:
         deployment_id: ID of the deployment to post
     """
+    import requests
     webhook_url = os.getenv("ANT_RUNNER_ENVIRONMENTS_WEBHOOK_URL")
     if not webhook_url:
         print("Error: ANT_RUNNER_ENVIRONMENTS_WEBHOOK_URL environment variable is not set")
@@ -234,6 +269,8 @@ def smoke_test(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to test
     """
+    # Imported here because prompt_toolkit is slow to load and the listing commands don't need it.
+    import questionary
     repo = NetworkDeploymentRepository()
     deployment = repo.get_by_id(deployment_id)
     if not deployment:
@@ -339,6 +376,7 @@ def upload_report(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to upload report for
     """
+    import questionary
     try:
         repo = NetworkDeploymentRepository()
         deployment = repo.get_by_id(deployment_id)
@@ -385,8 +423,8 @@ def upload_report(deployment_id: int) -> None:
             validate=lambda text: text.replace('.', '').isdigit()
         ).ask()
 
-        start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_datetime = parse_timestamp(start_time)
+        end_datetime = parse_timestamp(end_time)
         duration_seconds = (end_datetime - start_datetime).total_seconds()
         duration_hours = duration_seconds / 3600
 
@@ -416,6 +454,7 @@ def download_report(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to generate download report for
     """
+    import questionary
     try:
         repo = NetworkDeploymentRepository()
         deployment = repo.get_by_id(deployment_id)
@@ -425,8 +464,8 @@ def download_report(deployment_id: int) -> None:
         start_time = questionary.text("Start time:").ask()
         end_time = questionary.text("End time:").ask()
         
-        start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_datetime = parse_timestamp(start_time)
+        end_datetime = parse_timestamp(end_time)
         duration_seconds = (end_datetime - start_datetime).total_seconds()
         duration_hours = duration_seconds / 3600
         
@@ -502,15 +541,13 @@ def start_clients(network_name: str) -> None:
     Args:
         network_name: Name of the network to start clients in
     """
+    from runner.cmd.workflows import dispatch_many
     config = {
         "network-name": network_name
     }
     
-    print("\nStarting uploaders...")
-    start_uploaders(config, "main", force=True, wait=False)
-    
-    print("\nStarting downloaders...")
-    start_downloaders(config, "main", force=True, wait=False)
+    print("\nStarting uploaders and downloaders...")
+    dispatch_many([("start_uploaders", config), ("start_downloaders", config)], "main")
 
 def stop_clients(network_name: str) -> None:
     """Stop clients for a network.
@@ -518,15 +555,13 @@ def stop_clients(network_name: str) -> None:
     Args:
         network_name: Name of the network to stop clients in
     """
+    from runner.cmd.workflows import dispatch_many
     config = {
         "network-name": network_name
     }
     
-    print("\nStopping uploaders...")
-    stop_uploaders(config, "main", force=True, wait=False)
-    
-    print("\nStopping downloaders...")
-    stop_downloaders(config, "main", force=True, wait=False)
+    print("\nStopping uploaders and downloaders...")
+    dispatch_many([("stop_uploaders", config), ("stop_downloaders", config)], "main")
 
 def linear(deployment_id: int) -> None:
     """Create an issue in Linear for a deployment.
@@ -534,6 +569,17 @@ def linear(deployment_id: int) -> None:
     Args:
         deployment_id: ID of the deployment to create an issue for
     """
+    import questionary
+    # Imported here so that the listing commands don't load requests through the Linear client.
+    from runner.linear import (
+        Team,
+        IssueLabel,
+        create_issue,
+        create_project_update,
+        get_projects,
+        get_issue_label_id,
+        get_state_id,
+    )
     try:
         repo = NetworkDeploymentRepository()
         deployment = repo.get_by_id(deployment_id)
@@ -2,12 +2,19 @@ import os
 import requests
 import sys
 
-from typing import Dict
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache, wraps
+from itertools import chain, cycle, islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple
 
-import questionary
 from rich import print as rprint
+from rich.console import Console
+from rich.markup import escape
 
 from runner.db import ClientDeploymentRepository, NetworkDeploymentRepository, WorkflowRunRepository
+from runner.reporting import format_timestamp
 from runner.workflows import *
 
 REPO_OWNER = "maidsafe"
@@ -41,8 +48,8 @@ TELEGRAF_UPGRADE_NODE_CONFIG_WORKFLOW_ID = 154514014
 START_DOWNLOADERS_WORKFLOW_ID = 155894274
 STOP_DOWNLOADERS_WORKFLOW_ID = 155894275
 
-ENVIRONMENT_DEFAULTS = {
-    "development": {
+ENVIRONMENT_DEFAULTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "development": MappingProxyType({
         "peer_cache_node_count": 5,
         "generic_node_count": 25,
         "full_cone_private_node_count": 25,
@@ -62,8 +69,8 @@ ENVIRONMENT_DEFAULTS = {
         "symmetric_nat_gateway_vm_size": "s-4vcpu-8gb",
         "client_vm_size": "s-2vcpu-4gb",
         "region": "lon1"
-    },
-    "staging": {
+    }),
+    "staging": MappingProxyType({
         "peer_cache_node_count": 5,
         "generic_node_count": 25,
         "full_cone_private_node_count": 25,
@@ -83,8 +90,8 @@ ENVIRONMENT_DEFAULTS = {
         "symmetric_nat_gateway_vm_size": "s-2vcpu-4gb",
         "client_vm_size": "s-2vcpu-4gb",
         "region": "lon1"
-    },
-    "production": {
+    }),
+    "production": MappingProxyType({
         "peer_cache_node_count": 5,
         "generic_node_count": 25,
         "full_cone_private_node_count": 25,
@@ -104,9 +111,206 @@ ENVIRONMENT_DEFAULTS = {
         "symmetric_nat_gateway_vm_size": "s-8vcpu-16gb",
         "client_vm_size": "s-8vcpu-16gb",
         "region": "lon1"
-    }
+    })
+})
+
+_console = Console(soft_wrap=True)
+
+_WORKFLOW_BANNER = "\n".join([
+    "=" * 61,
+    " " * 19 + "R U N  W O R K F L O W" + " " * 20,
+    "=" * 61,
+]) + "\n\n"
+_RUNS_BANNER = "\n".join([
+    "=" * 61,
+    " " * 18 + "W O R K F L O W   R U N S" + " " * 18,
+    "=" * 61,
+]) + "\n\n"
+
+_RUN_HEADER = f"{'Triggered':<20} {'Workflow':<25} {'Network':<15}\n" + "-" * 60 + "\n"
+_RUN_ROW_FORMAT = "{0.triggered_at:<20} {1}{0.workflow_name:<25}{2} {0.network_name:<15}".format
+_RUN_STATUS_HEADER = f"{'Triggered':<20} {'Workflow':<25} {'Network':<15} {'Status':<11}\n" + "-" * 72 + "\n"
+_RUN_STATUS_ROW_FORMAT = "{0.triggered_at:<20} {1}{0.workflow_name:<25}{2} {0.network_name:<15} {3:<11}".format
+# The compact rows only colour the workflow name, so they are written with plain ANSI codes rather
+# than being parsed as markup.
+_RUN_ROW_COLOURS = ("\x1b[32m", "\x1b[0m")
+_RUN_ROW_NO_COLOURS = ("", "")
+_RUN_DETAILS_TITLE_FORMAT = "Workflow: [green]{}[/green]".format
+_RUN_DETAILS_FORMAT = (
+    "Triggered: {}\n"
+    "Network: {}\n"
+    "Branch: {}\n"
+    f"URL: https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{{}}\n"
+    "Inputs:"
+).format
+_RUN_INPUT_FORMAT = "  {}: {}".format
+_DISPATCH_SUMMARY_HEADER = f"{'Command':<30} {'Network':<15} Result\n" + "-" * 72 + "\n"
+_DISPATCH_SUMMARY_ROW_FORMAT = "{:<30} {:<15} {}".format
+
+_NODE_TYPES: Dict[Optional[str], Optional[NodeType]] = {node_type.value: node_type for node_type in NodeType}
+_NODE_TYPES[None] = None
+
+def _as_node_type(value: Optional[str]) -> Optional[NodeType]:
+    """
+    Convert a node-type input to a NodeType.
+    
+    Args:
+        value: The node-type input from the config
+        
+    Returns:
+        Optional[NodeType]: The node type, or None if the input was not provided
+        
+    Raises:
+        ValueError: If the value is not a valid node type
+    """
+    try:
+        return _NODE_TYPES[value]
+    except (KeyError, TypeError):
+        # Let the enum raise its usual error for an unknown or unhashable value.
+        return NodeType(value)
+
+@dataclass(frozen=True)
+class WorkflowSchema:
+    """The configuration inputs accepted by a workflow command."""
+    required: Tuple[str, ...] = ("network-name",)
+    optional: Tuple[str, ...] = ()
+    coercions: Dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+    testnet_deploy_args: bool = True
+    pass_config: bool = False
+    fields: Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...] = field(
+        init=False, repr=False, compare=False)
+    required_keys: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "required_keys", frozenset(self.required))
+        # Resolve each input's constructor argument name and coercion once, when the table is built.
+        object.__setattr__(self, "fields", tuple(
+            (name, name.replace("-", "_"), self.coercions.get(name))
+            for name in self.required + self.optional
+        ))
+
+_SCHEMAS = {
+    "deposit_funds": WorkflowSchema(
+        required=("network-name", "provider"),
+        optional=("funding-wallet-secret-key", "gas-to-transfer", "tokens-to-transfer")
+    ),
+    "destroy_network": WorkflowSchema(),
+    "drain_funds": WorkflowSchema(optional=("to-address",)),
+    "kill_droplets": WorkflowSchema(
+        required=("droplet-names", "network-name"),
+        testnet_deploy_args=False
+    ),
+    "network_status": WorkflowSchema(optional=("ansible-forks",)),
+    "nginx_upgrade_config": WorkflowSchema(optional=("ansible-forks", "custom-inventory")),
+    "reset_to_n_nodes": WorkflowSchema(
+        required=("network-name", "evm-network-type", "node-count"),
+        optional=("custom-inventory", "forks", "node-type", "start-interval", "stop-interval", "version"),
+        coercions={"node-count": str, "node-type": _as_node_type}
+    ),
+    "stop_nodes": WorkflowSchema(
+        optional=("ansible-forks", "custom-inventory", "delay", "interval", "node-type", "service-names"),
+        coercions={"node-type": _as_node_type}
+    ),
+    "start_nodes": WorkflowSchema(
+        optional=("ansible-forks", "custom-inventory", "interval", "node-type"),
+        coercions={"node-type": _as_node_type}
+    ),
+    "start_uploaders": WorkflowSchema(),
+    "start_telegraf": WorkflowSchema(
+        optional=("ansible-forks", "custom-inventory", "delay", "node-type"),
+        coercions={"node-type": _as_node_type}
+    ),
+    "stop_telegraf": WorkflowSchema(
+        optional=("ansible-forks", "custom-inventory", "delay", "node-type"),
+        coercions={"node-type": _as_node_type}
+    ),
+    "stop_uploaders": WorkflowSchema(),
+    "upgrade_antctl": WorkflowSchema(
+        required=("network-name", "version"),
+        optional=("custom-inventory", "node-type"),
+        coercions={"node-type": _as_node_type}
+    ),
+    "upgrade_network": WorkflowSchema(
+        required=("network-name", "version"),
+        optional=("ansible-forks", "custom-inventory", "delay", "interval", "node-type", "force"),
+        coercions={"node-type": _as_node_type}
+    ),
+    "update_peer": WorkflowSchema(
+        required=("network-name", "peer"),
+        optional=("custom-inventory", "node-type"),
+        coercions={"node-type": _as_node_type},
+        testnet_deploy_args=False
+    ),
+    "upgrade_clients": WorkflowSchema(required=("network-name", "version")),
+    "upscale_network": WorkflowSchema(testnet_deploy_args=False, pass_config=True),
+    "telegraf_upgrade_client_config": WorkflowSchema(optional=("ansible-forks", "ansible-verbose")),
+    "telegraf_upgrade_geoip_config": WorkflowSchema(optional=("ansible-forks", "ansible-verbose")),
+    "telegraf_upgrade_node_config": WorkflowSchema(optional=("ansible-forks", "ansible-verbose")),
+    "start_downloaders": WorkflowSchema(),
+    "stop_downloaders": WorkflowSchema(),
+}
+
+@dataclass(frozen=True, slots=True)
+class WorkflowTarget:
+    """The GitHub workflow dispatched by a command, and the class that represents it."""
+    owner: str
+    repo: str
+    id: int
+    workflow_cls: type
+
+_TARGETS = {
+    "deposit_funds": WorkflowTarget(REPO_OWNER, REPO_NAME, DEPOSIT_FUNDS_WORKFLOW_ID, DepositFundsWorkflow),
+    "destroy_network": WorkflowTarget(REPO_OWNER, REPO_NAME, DESTROY_NETWORK_WORKFLOW_ID, DestroyNetworkWorkflow),
+    "drain_funds": WorkflowTarget(REPO_OWNER, REPO_NAME, DRAIN_FUNDS_WORKFLOW_ID, DrainFundsWorkflow),
+    "kill_droplets": WorkflowTarget(REPO_OWNER, REPO_NAME, KILL_DROPLETS_WORKFLOW_ID, KillDropletsWorkflow),
+    "network_status": WorkflowTarget(REPO_OWNER, REPO_NAME, NETWORK_STATUS_WORKFLOW_ID, NetworkStatusWorkflow),
+    "nginx_upgrade_config": WorkflowTarget(REPO_OWNER, REPO_NAME, NGINX_UPGRADE_CONFIG_WORKFLOW_ID, NginxUpgradeConfigWorkflow),
+    "reset_to_n_nodes": WorkflowTarget(REPO_OWNER, REPO_NAME, RESET_TO_N_NODES_WORKFLOW_ID, ResetToNNodesWorkflow),
+    "stop_nodes": WorkflowTarget(REPO_OWNER, REPO_NAME, STOP_NODES_WORKFLOW_ID, StopNodesWorkflowRun),
+    "start_nodes": WorkflowTarget(REPO_OWNER, REPO_NAME, START_NODES_WORKFLOW_ID, StartNodesWorkflow),
+    "start_uploaders": WorkflowTarget(REPO_OWNER, REPO_NAME, START_UPLOADERS_WORKFLOW_ID, StartUploadersWorkflow),
+    "start_telegraf": WorkflowTarget(REPO_OWNER, REPO_NAME, START_TELEGRAF_WORKFLOW_ID, StartTelegrafWorkflow),
+    "stop_telegraf": WorkflowTarget(REPO_OWNER, REPO_NAME, STOP_TELEGRAF_WORKFLOW_ID, StopTelegrafWorkflow),
+    "stop_uploaders": WorkflowTarget(REPO_OWNER, REPO_NAME, STOP_UPLOADERS_WORKFLOW_ID, StopUploadersWorkflow),
+    "upgrade_antctl": WorkflowTarget(REPO_OWNER, REPO_NAME, UPGRADE_ANTCTL_WORKFLOW_ID, UpgradeAntctlWorkflow),
+    "upgrade_network": WorkflowTarget(REPO_OWNER, REPO_NAME, UPGRADE_NETWORK_WORKFLOW_ID, UpgradeNetworkWorkflow),
+    "update_peer": WorkflowTarget(REPO_OWNER, REPO_NAME, UPDATE_PEER_WORKFLOW_ID, UpdatePeerWorkflow),
+    "upgrade_clients": WorkflowTarget(REPO_OWNER, REPO_NAME, UPGRADE_CLIENTS_WORKFLOW_ID, UpgradeClientsWorkflow),
+    "upscale_network": WorkflowTarget(REPO_OWNER, REPO_NAME, UPSCALE_NETWORK_WORKFLOW_ID, UpscaleNetworkWorkflow),
+    "telegraf_upgrade_client_config": WorkflowTarget(REPO_OWNER, REPO_NAME, TELEGRAF_UPGRADE_CLIENT_CONFIG_WORKFLOW_ID, TelegrafUpgradeClientConfigWorkflow),
+    "telegraf_upgrade_geoip_config": WorkflowTarget(REPO_OWNER, REPO_NAME, TELEGRAF_UPGRADE_GEOIP_CONFIG_WORKFLOW_ID, TelegrafUpgradeGeoipConfigWorkflow),
+    "telegraf_upgrade_node_config": WorkflowTarget(REPO_OWNER, REPO_NAME, TELEGRAF_UPGRADE_NODE_CONFIG_WORKFLOW_ID, TelegrafUpgradeNodeConfigWorkflow),
+    "start_downloaders": WorkflowTarget(REPO_OWNER, REPO_NAME, START_DOWNLOADERS_WORKFLOW_ID, StartDownloadersWorkflow),
+    "stop_downloaders": WorkflowTarget(REPO_OWNER, REPO_NAME, STOP_DOWNLOADERS_WORKFLOW_ID, StopDownloadersWorkflow),
 }
 
+def _handle_dispatch_errors(func: Callable) -> Callable:
+    """
+    Report configuration and API errors from a workflow command and exit with a failure status.
+    
+    Args:
+        func: The command function to wrap
+        
+    Returns:
+        Callable: The wrapped function
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except KeyError as e:
+            print(f"Error: Missing required configuration field: {e}")
+            sys.exit(1)
+        except ValueError as e:
+            # Not every ValueError is about the inputs, e.g. a missing token, so it is printed as it is.
+            print(f"Error: {e}")
+            sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            print(f"Error: Failed to trigger workflow: {e}")
+            sys.exit(1)
+    return wrapper
+
+@_handle_dispatch_errors
 def bootstrap_network(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Bootstrap a new network."""
     _print_workflow_banner()
@@ -122,114 +326,38 @@ def bootstrap_network(config: Dict, branch_name: str, force: bool = False, wait:
         config=config
     )
     
-    try:
-        workflow_run_id = workflow.run(force=force, wait=wait)
-        env_type = config.get("environment-type", "development")
-        defaults = ENVIRONMENT_DEFAULTS[env_type]
-        repo = NetworkDeploymentRepository()
-        repo.record_deployment(workflow_run_id, config, defaults, is_bootstrap=True)
-        print("Workflow was dispatched with the following inputs:")
-        for key, value in workflow.get_workflow_inputs().items():
-            print(f"  {key}: {value}")
-    except (KeyError, ValueError) as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Failed to trigger workflow: {e}")
-        sys.exit(1)
+    defaults = _get_environment_defaults(config)
+    workflow_run_id = workflow.run(force=force, wait=wait)
+    repo = NetworkDeploymentRepository()
+    repo.record_deployment(workflow_run_id, config, defaults, is_bootstrap=True)
+    _print_dispatched_inputs(workflow)
 
 def deposit_funds(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Deposit funds to network nodes."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    if "provider" not in config:
-        raise KeyError("provider")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = DepositFundsWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=DEPOSIT_FUNDS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        provider=config["provider"],
-        funding_wallet_secret_key=config.get("funding-wallet-secret-key"),
-        gas_to_transfer=config.get("gas-to-transfer"),
-        tokens_to_transfer=config.get("tokens-to-transfer"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("deposit_funds", config, branch_name, force, wait)
 
 def destroy_network(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Destroy a network."""
     if not force:
+        # Imported here because prompt_toolkit is slow to load and no other command needs it.
+        import questionary
         if not questionary.confirm(
             "Have you drained funds from this network?",
             default=False
         ).ask():
             print("Error: Please drain funds from the network before destroying it")
             sys.exit(1)
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = DestroyNetworkWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=DESTROY_NETWORK_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("destroy_network", config, branch_name, force, wait)
 
 def drain_funds(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Drain funds from network nodes."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = DrainFundsWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=DRAIN_FUNDS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        to_address=config.get("to-address"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("drain_funds", config, branch_name, force, wait)
 
 def kill_droplets(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Kill specified droplets."""
-    if "droplet-names" not in config:
-        raise KeyError("droplet-names")
-    
-    _print_workflow_banner()
-        
-    workflow = KillDropletsWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=KILL_DROPLETS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        droplet_names=config["droplet-names"]
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("kill_droplets", config, branch_name, force, wait)
 
+@_handle_dispatch_errors
 def launch_network(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Launch a new network."""
     _print_workflow_banner()
@@ -244,31 +372,21 @@ def launch_network(config: Dict, branch_name: str, force: bool = False, wait: bo
         config=config
     )
     
+    defaults = _get_environment_defaults(config)
     try:
         workflow_run_id = workflow.run(force=force, wait=wait)
-        env_type = config.get("environment-type", "development")
-        defaults = ENVIRONMENT_DEFAULTS[env_type]
         repo = NetworkDeploymentRepository()
         repo.record_deployment(workflow_run_id, config, defaults)
-        print("Workflow was dispatched with the following inputs:")
-        for key, value in workflow.get_workflow_inputs().items():
-            print(f"  {key}: {value}")
+        _print_dispatched_inputs(workflow)
     except WorkflowRunFailedError as e:
         # The workflow run failed while waiting for it to complete, but we want the deployment to
         # be recorded anyway, because we can possibly re-run the workflow and it will succeed.
-        env_type = config.get("environment-type", "development")
-        defaults = ENVIRONMENT_DEFAULTS[env_type]
         repo = NetworkDeploymentRepository()
         repo.record_deployment(e.run_id, config, defaults)
         print(f"Error: Workflow run failed with conclusion: {e.conclusion}")
         sys.exit(1)
-    except (KeyError, ValueError) as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Failed to trigger workflow: {e}")
-        sys.exit(1)
 
+@_handle_dispatch_errors
 def launch_legacy_network(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Launch a new legacy network."""
     _print_workflow_banner()
@@ -283,460 +401,153 @@ def launch_legacy_network(config: Dict, branch_name: str, force: bool = False, w
         config=config
     )
     
-    try:
-        workflow_run_id = workflow.run(force=force, wait=wait)
-        env_type = config.get("environment-type", "development")
-        defaults = ENVIRONMENT_DEFAULTS[env_type]
-        
-        repo = NetworkDeploymentRepository()
-        repo.record_deployment(workflow_run_id, config, defaults, is_legacy=True)
-        print("Workflow was dispatched with the following inputs:")
-        for key, value in workflow.get_workflow_inputs().items():
-            print(f"  {key}: {value}")
-    except (KeyError, ValueError) as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Failed to trigger workflow: {e}")
-        sys.exit(1)
+    defaults = _get_environment_defaults(config)
+    workflow_run_id = workflow.run(force=force, wait=wait)
+    
+    repo = NetworkDeploymentRepository()
+    repo.record_deployment(workflow_run_id, config, defaults, is_legacy=True)
+    _print_dispatched_inputs(workflow)
 
-def ls(show_details: bool = False, workflow_name: str = None, network_name: str = None) -> None:
+def ls(show_details: bool = False, workflow_name: str = None, network_name: str = None,
+       limit: Optional[int] = None, before: Optional[datetime] = None,
+       since: Optional[datetime] = None, show_status: bool = False) -> None:
     """List all recorded workflow runs."""
 
     repo = WorkflowRunRepository()
-    runs = repo.list_workflow_runs()
-    if not runs:
-        print("No workflow runs found.")
+    iter_runs = repo.iter_workflow_runs if show_details else repo.iter_workflow_run_rows
+    runs = iter_runs(
+        workflow_name=workflow_name,
+        network_name=network_name,
+        limit=limit,
+        before=before,
+        since=since
+    )
+    first_run = next(runs, None)
+    if first_run is None:
+        if workflow_name or network_name or before or since:
+            print("No matching workflow runs found.")
+        else:
+            print("No workflow runs found.")
         return
     
-    if workflow_name:
-        runs = [run for run in runs if workflow_name.lower() in run.workflow_name.lower()]
-    if network_name:
-        runs = [run for run in runs if network_name.lower() in run.network_name.lower()]
-    if not runs:
-        print("No matching workflow runs found.")
-        return
+    runs = chain([first_run], runs)
+    if show_status:
+        # The states for all the runs are fetched together, so the rows can't be streamed.
+        runs = list(runs)
+        try:
+            states = fetch_run_states(
+                REPO_OWNER,
+                REPO_NAME,
+                _get_github_token(),
+                [run.run_id for run in runs],
+                datetime.fromisoformat(runs[0].triggered_at),
+                datetime.fromisoformat(runs[-1].triggered_at)
+            )
+        except (ValueError, requests.exceptions.RequestException) as e:
+            print(f"Error: Failed to fetch workflow run statuses: {e}")
+            sys.exit(1)
         
-    print("=" * 61)
-    print(" " * 18 + "W O R K F L O W   R U N S" + " " * 18)
-    print("=" * 61 + "\n")
+    sys.stdout.write(_RUNS_BANNER)
     
     if show_details:
-        for run in runs:
-            timestamp = run.triggered_at.strftime("%Y-%m-%d %H:%M:%S")
-            
-            rprint(f"Workflow: [green]{run.workflow_name}[/green]")
-            print(f"Triggered: {timestamp}")
-            print(f"Network: {run.network_name}")
-            print(f"Branch: {run.branch_name}")
-            print(f"URL: https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{run.run_id}")
-            print("Inputs:")
-            for key, value in run.inputs.items():
-                print(f"  {key}: {value}")
-            print("-" * 50)
+        # Only the title is markup; everything else is escaped so input values print verbatim.
+        blocks = (
+            _RUN_DETAILS_TITLE_FORMAT(run.workflow_name) + "\n" + escape("\n".join([
+                _RUN_DETAILS_FORMAT(
+                    format_timestamp(run.triggered_at),
+                    run.network_name,
+                    run.branch_name,
+                    run.run_id
+                ),
+                *(_RUN_INPUT_FORMAT(key, value) for key, value in run.inputs.items()),
+                "-" * 50
+            ]))
+            for run in runs
+        )
+        _write_in_batches(blocks)
     else:
-        print(f"{'Triggered':<20} {'Workflow':<25} {'Network':<15}")
-        print("-" * 60)
-        
-        for run in runs:
-            timestamp = run.triggered_at.strftime("%Y-%m-%d %H:%M:%S")
-            rprint(f"{timestamp:<20} [green]{run.workflow_name:<25}[/green] {run.network_name:<15}")
+        colour_on, colour_off = _RUN_ROW_COLOURS if _console.color_system else _RUN_ROW_NO_COLOURS
+        if show_status:
+            sys.stdout.write(_RUN_STATUS_HEADER)
+            rows = (
+                _RUN_STATUS_ROW_FORMAT(run, colour_on, colour_off, states.get(run.run_id, "unknown"))
+                for run in runs
+            )
+        else:
+            sys.stdout.write(_RUN_HEADER)
+            
+            # The timestamp is already formatted by the query.
+            rows = (_RUN_ROW_FORMAT(run, colour_on, colour_off) for run in runs)
+        sys.stdout.writelines(row + "\n" for row in rows)
     
     print("\nAll times are in UTC")
 
 def network_status(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Check status of nodes in a testnet network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = NetworkStatusWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=NETWORK_STATUS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("network_status", config, branch_name, force, wait)
 
 def nginx_upgrade_config(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Upgrade nginx configuration on network nodes."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = NginxUpgradeConfigWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=NGINX_UPGRADE_CONFIG_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        custom_inventory=config.get("custom-inventory"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("nginx_upgrade_config", config, branch_name, force, wait)
 
 def reset_to_n_nodes(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Reset network to run specified number of nodes."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    if "evm-network-type" not in config:
-        raise KeyError("evm-network-type")
-    if "node-count" not in config:
-        raise KeyError("node-count")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = ResetToNNodesWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=RESET_TO_N_NODES_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        evm_network_type=config["evm-network-type"],
-        node_count=str(config["node-count"]),
-        custom_inventory=config.get("custom-inventory"),
-        forks=config.get("forks"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        start_interval=config.get("start-interval"),
-        stop_interval=config.get("stop-interval"),
-        version=config.get("version"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("reset_to_n_nodes", config, branch_name, force, wait)
 
 def stop_nodes(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = StopNodesWorkflowRun(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=STOP_NODES_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        custom_inventory=config.get("custom-inventory"),
-        delay=config.get("delay"),
-        interval=config.get("interval"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        service_names=config.get("service-names"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("stop_nodes", config, branch_name, force, wait)
 
 def start_nodes(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Start nodes in a testnet network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = StartNodesWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=START_NODES_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        custom_inventory=config.get("custom-inventory"),
-        interval=config.get("interval"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("start_nodes", config, branch_name, force, wait)
 
 def start_uploaders(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Start uploaders in a testnet network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = StartUploadersWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=START_UPLOADERS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("start_uploaders", config, branch_name, force, wait)
 
 def start_telegraf(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = StartTelegrafWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=START_TELEGRAF_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        custom_inventory=config.get("custom-inventory"),
-        delay=config.get("delay"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("start_telegraf", config, branch_name, force, wait)
 
 def stop_telegraf(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = StopTelegrafWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=STOP_TELEGRAF_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        custom_inventory=config.get("custom-inventory"),
-        delay=config.get("delay"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("stop_telegraf", config, branch_name, force, wait)
 
 def stop_uploaders(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Stop uploaders in a testnet network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = StopUploadersWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=STOP_UPLOADERS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("stop_uploaders", config, branch_name, force, wait)
 
 def upgrade_antctl(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Upgrade antctl version."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    if "version" not in config:
-        raise KeyError("version")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = UpgradeAntctlWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=UPGRADE_ANTCTL_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        version=config["version"],
-        custom_inventory=config.get("custom-inventory"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("upgrade_antctl", config, branch_name, force, wait)
 
 def upgrade_network(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Trigger the upgrade network workflow."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    if "version" not in config:
-        raise KeyError("version")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = UpgradeNetworkWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=UPGRADE_NETWORK_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        version=config["version"],
-        ansible_forks=config.get("ansible-forks"),
-        custom_inventory=config.get("custom-inventory"),
-        delay=config.get("delay"),
-        interval=config.get("interval"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None,
-        force=config.get("force"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("upgrade_network", config, branch_name, force, wait)
 
 def update_peer(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Trigger the update peer workflow."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    if "peer" not in config:
-        raise KeyError("peer")
-    
-    _print_workflow_banner()
-        
-    workflow = UpdatePeerWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=UPDATE_PEER_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        peer=config["peer"],
-        custom_inventory=config.get("custom-inventory"),
-        node_type=NodeType(config["node-type"]) if "node-type" in config else None
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("update_peer", config, branch_name, force, wait)
 
 def upgrade_clients(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Trigger the upgrade Clients workflow."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    if "version" not in config:
-        raise KeyError("version")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = UpgradeClientsWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=UPGRADE_CLIENTS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        version=config["version"],
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("upgrade_clients", config, branch_name, force, wait)
 
 def upscale_network(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Upscale an existing network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-        
-    workflow = UpscaleNetworkWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=UPSCALE_NETWORK_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        config=config
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("upscale_network", config, branch_name, force, wait)
 
 def telegraf_upgrade_client_config(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Upgrade Telegraf client configuration."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = TelegrafUpgradeClientConfigWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=TELEGRAF_UPGRADE_CLIENT_CONFIG_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        ansible_verbose=config.get("ansible-verbose"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("telegraf_upgrade_client_config", config, branch_name, force, wait)
 
 def telegraf_upgrade_geoip_config(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Upgrade Telegraf GeoIP configuration."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = TelegrafUpgradeGeoipConfigWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=TELEGRAF_UPGRADE_GEOIP_CONFIG_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        ansible_verbose=config.get("ansible-verbose"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("telegraf_upgrade_geoip_config", config, branch_name, force, wait)
 
 def telegraf_upgrade_node_config(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Upgrade Telegraf node configuration."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
-    
-    _print_workflow_banner()
-    
-    testnet_deploy_args = _build_testnet_deploy_args(config)
-        
-    workflow = TelegrafUpgradeNodeConfigWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=TELEGRAF_UPGRADE_NODE_CONFIG_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        ansible_forks=config.get("ansible-forks"),
-        ansible_verbose=config.get("ansible-verbose"),
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    _dispatch("telegraf_upgrade_node_config", config, branch_name, force, wait)
 
+@_handle_dispatch_errors
 def client_deploy(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Deploy clients to an existing network."""
     _print_workflow_banner()
@@ -751,20 +562,12 @@ def client_deploy(config: Dict, branch_name: str, force: bool = False, wait: boo
         config=config
     )
     
-    try:
-        workflow_run_id = workflow.run(force=force, wait=wait)
-        repo = ClientDeploymentRepository()
-        repo.record_client_deployment(workflow_run_id, config)
-        print("Workflow was dispatched with the following inputs:")
-        for key, value in workflow.get_workflow_inputs().items():
-            print(f"  {key}: {value}")
-    except (KeyError, ValueError) as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Failed to trigger workflow: {e}")
-        sys.exit(1)
+    workflow_run_id = workflow.run(force=force, wait=wait)
+    repo = ClientDeploymentRepository()
+    repo.record_client_deployment(workflow_run_id, config)
+    _print_dispatched_inputs(workflow)
 
+@_handle_dispatch_errors
 def client_deploy_static_downloaders(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Deploy static downloaders to an existing network."""
     _print_workflow_banner()
@@ -779,101 +582,293 @@ def client_deploy_static_downloaders(config: Dict, branch_name: str, force: bool
         config=config
     )
     
-    try:
-        workflow_run_id = workflow.run(force=force, wait=wait)
-        db_config = config.copy()
-        db_config["deployment-name"] = config["name"]
-        repo = ClientDeploymentRepository()
-        repo.record_client_deployment(workflow_run_id, db_config)
-        print("Workflow was dispatched with the following inputs:")
-        for key, value in workflow.get_workflow_inputs().items():
-            print(f"  {key}: {value}")
-    except (KeyError, ValueError) as e:
-        print(f"Error: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Failed to trigger workflow: {e}")
-        sys.exit(1)
+    workflow_run_id = workflow.run(force=force, wait=wait)
+    db_config = config.copy()
+    db_config["deployment-name"] = config["name"]
+    repo = ClientDeploymentRepository()
+    repo.record_client_deployment(workflow_run_id, db_config)
+    _print_dispatched_inputs(workflow)
 
 def start_downloaders(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
     """Start downloaders in a network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
+    _dispatch("start_downloaders", config, branch_name, force, wait)
+
+def stop_downloaders(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
+    """Stop downloaders in a testnet network."""
+    _dispatch("stop_downloaders", config, branch_name, force, wait)
+
+@_handle_dispatch_errors
+def dispatch_many(commands: List[Tuple[str, Dict]], branch_name: str, force: bool = True,
+                  wait: bool = False) -> List[int]:
+    """
+    Dispatch the workflows for several commands concurrently.
     
-    _print_workflow_banner()
+    Once they have all been dispatched, a summary with the run URL or error for each command is
+    printed. If any failed, the ones that were accepted are still recorded, but the process then
+    exits with a failure status.
     
-    testnet_deploy_args = _build_testnet_deploy_args(config)
+    Args:
+        commands: Pairs of command name and config, e.g. ("start_uploaders", {"network-name": "DEV-01"})
+        branch_name: The branch the workflows will run on
+        force: If False, prompt for confirmation of each workflow before any are dispatched
+        wait: If True, wait for every workflow run to complete
         
-    workflow = StartDownloadersWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=START_DOWNLOADERS_WORKFLOW_ID,
-        personal_access_token=_get_github_token(),
-        branch_name=branch_name,
-        network_name=config["network-name"],
-        testnet_deploy_args=testnet_deploy_args
-    )
-    _execute_workflow(workflow, force, wait)
+    Returns:
+        List[int]: The workflow run IDs, in the same order as the commands
+        
+    Raises:
+        WorkflowRunFailedError: If waiting for completion and a workflow run fails
+    """
+    _print_workflow_banner()
+    workflows = [_build_workflow(command, config, branch_name) for command, config in commands]
+    if not force:
+        for workflow in workflows:
+            workflow._confirm_workflow()
+    results = dispatch_workflows(workflows)
+    dispatched = [(workflow, result) for workflow, result in zip(workflows, results)
+                  if not isinstance(result, Exception)]
+    for workflow, _ in dispatched:
+        rprint(f"The [green]{workflow.name}[/green] workflow was dispatched with the following inputs:")
+        print(_format_inputs(workflow.inputs))
+    _print_dispatch_summary(commands, workflows, results)
+    if len(dispatched) < len(workflows):
+        sys.exit(1)
+    if wait:
+        # The runs are already going in parallel, so waiting on each in turn takes as long as the slowest.
+        for workflow, run_id in dispatched:
+            workflow._wait_for_completion(run_id)
+    return [run_id for _, run_id in dispatched]
+
+def _print_dispatch_summary(commands: List[Tuple[str, Dict]], workflows: List[WorkflowRun],
+                            results: List[int | Exception]) -> None:
+    """
+    Print a table with the run URL, or the error, for each workflow in a batch.
+    
+    Args:
+        commands: Pairs of command name and config, in the same order as the workflows
+        workflows: The workflows that were dispatched
+        results: The run ID or error for each workflow
+    """
+    rows = []
+    for (command, _), workflow, result in zip(commands, workflows, results):
+        if isinstance(result, Exception):
+            outcome = f"Error: {result}"
+        else:
+            outcome = f"https://github.com/{workflow.owner}/{workflow.repo}/actions/runs/{result}"
+        rows.append(_DISPATCH_SUMMARY_ROW_FORMAT(command.replace("_", "-"), workflow.network_name, outcome))
+    print()
+    sys.stdout.write(_DISPATCH_SUMMARY_HEADER)
+    sys.stdout.writelines(row + "\n" for row in rows)
+    print()
+
+def dispatch_batch(commands: List[Tuple[str, Dict]], branch_name: str, force: bool = False,
+                   wait: bool = False) -> None:
+    """
+    Dispatch a batch of independent workflows from a batch file concurrently.
+    
+    The batch is checked before anything is confirmed or dispatched: each command must be one that
+    can be batched, and the same command can't be listed twice with the same inputs.
+    
+    Args:
+        commands: Pairs of subcommand name and config, e.g. ("start-telegraf", {"network-name": "DEV-01"})
+        branch_name: The branch the workflows will run on
+        force: If True, skip the confirmation prompts
+        wait: If True, wait for every workflow run to complete
+    """
+    batch = []
+    for command, config in commands:
+        name = command.replace("-", "_")
+        # Commands that record deployments have their own dispatch functions and can't be batched.
+        if name not in _SCHEMAS:
+            print(f"Error: The {command} workflow can't be dispatched as part of a batch")
+            sys.exit(1)
+        if (name, config) in batch:
+            print(f"Error: The {command} workflow is listed more than once with the same inputs")
+            sys.exit(1)
+        batch.append((name, config))
+    dispatch_many(batch, branch_name, force, wait)
 
-def stop_downloaders(config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
-    """Stop downloaders in a testnet network."""
-    if "network-name" not in config:
-        raise KeyError("network-name")
+@_handle_dispatch_errors
+def _dispatch(command: str, config: Dict, branch_name: str, force: bool = False, wait: bool = False) -> None:
+    """
+    Build and execute the workflow for a command.
     
+    Args:
+        command: The name of the command
+        config: Dictionary containing workflow configuration
+        branch_name: The branch the workflow will run on
+        force: If True, skip confirmation prompt
+        wait: If True, wait for workflow completion
+        
+    Raises:
+        KeyError: If a required configuration field is missing
+    """
     _print_workflow_banner()
+    _execute_workflow(_build_workflow(command, config, branch_name), force, wait)
+
+def _build_workflow(command: str, config: Dict, branch_name: str) -> WorkflowRun:
+    """
+    Build the workflow for a command from the config inputs described by its schema.
     
-    testnet_deploy_args = _build_testnet_deploy_args(config)
+    Args:
+        command: The name of the command, used to look up its schema and workflow
+        config: Dictionary containing workflow configuration
+        branch_name: The branch the workflow will run on
         
-    workflow = StopDownloadersWorkflow(
-        owner=REPO_OWNER,
-        repo=REPO_NAME,
-        id=STOP_DOWNLOADERS_WORKFLOW_ID,
+    Returns:
+        WorkflowRun: The workflow, ready to be run
+        
+    Raises:
+        KeyError: If a required configuration field is missing
+    """
+    schema = _SCHEMAS[command]
+    target = _TARGETS[command]
+    kwargs = _validate(config, schema)
+    if schema.testnet_deploy_args:
+        kwargs["testnet_deploy_args"] = _build_testnet_deploy_args(config)
+    if schema.pass_config:
+        kwargs["config"] = config
+        
+    return target.workflow_cls(
+        owner=target.owner,
+        repo=target.repo,
+        id=target.id,
         personal_access_token=_get_github_token(),
         branch_name=branch_name,
-        network_name=config["network-name"],
-        testnet_deploy_args=testnet_deploy_args
+        **kwargs
     )
-    _execute_workflow(workflow, force, wait)
+
+def _validate(config: Dict, schema: WorkflowSchema) -> Dict[str, Any]:
+    """
+    Validate config inputs against a schema and convert them to workflow constructor arguments.
+    
+    Args:
+        config: Dictionary containing workflow configuration
+        schema: The schema describing the inputs for the workflow
+        
+    Returns:
+        Dict[str, Any]: The keyword arguments for the workflow constructor
+        
+    Raises:
+        KeyError: If a required configuration field is missing
+    """
+    missing = schema.required_keys - config.keys()
+    if missing:
+        # Report the first missing field in the order the schema lists them.
+        raise KeyError(next(name for name in schema.required if name in missing))
+    return {
+        argument: coerce(config[name]) if coerce else config[name]
+        for name, argument, coerce in schema.fields
+        if name in config
+    }
 
 def _execute_workflow(workflow, force: bool = False, wait: bool = False) -> None:
     """
-    Common function to execute a workflow and handle its output and errors.
+    Common function to execute a workflow and print its inputs.
     
     Args:
         workflow: The workflow instance to execute
         force: If True, skip confirmation prompt
         wait: If True, wait for workflow completion
     """
+    workflow.run(force=force, wait=wait)
+    _print_dispatched_inputs(workflow)
+
+def _format_inputs(inputs: Dict[str, Any]) -> str:
+    """
+    Format workflow inputs as an indented block, one input per line.
+    
+    Args:
+        inputs: The inputs the workflow was dispatched with
+        
+    Returns:
+        str: The formatted inputs
+    """
+    return "\n".join([_RUN_INPUT_FORMAT(key, value) for key, value in inputs.items()])
+
+def _print_dispatched_inputs(workflow: WorkflowRun) -> None:
+    """
+    Print the inputs a workflow was dispatched with, in a single write.
+    
+    Args:
+        workflow: The dispatched workflow
+    """
+    print(f"Workflow was dispatched with the following inputs:\n{_format_inputs(workflow.inputs)}")
+
+def _write_in_batches(lines: Iterable[str], batch_size: int = 100, highlight: bool = False) -> None:
+    """
+    Print lines of markup with one console write per batch, rather than one per line.
+    
+    Args:
+        lines: The lines to print, which are consumed lazily
+        batch_size: The number of lines to join into each write
+        highlight: Whether rich should highlight numbers, strings and so on
+    """
+    lines = iter(lines)
+    while batch := list(islice(lines, batch_size)):
+        _console.print("\n".join(batch), highlight=highlight)
+
+def _get_environment_defaults(config: Dict) -> Mapping[str, Any]:
+    """
+    Look up the deployment defaults for the environment type in a workflow config.
+
+    This is done before the workflow is dispatched, so an unknown environment type is reported
+    without a run having been started that could then not be recorded.
+
+    Args:
+        config: The workflow config
+
+    Returns:
+        Mapping[str, Any]: The read-only defaults for the environment type
+    """
+    env_type = config.get("environment-type", "development")
     try:
-        workflow.run(force=force, wait=wait)
-        print("Workflow was dispatched with the following inputs:")
-        for key, value in workflow.get_workflow_inputs().items():
-            print(f"  {key}: {value}")
-    except KeyError as e:
-        print(f"Error: Missing required configuration field: {e}")
-        sys.exit(1)
-    except ValueError as e:
-        print(f"Error: Invalid configuration value: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        print(f"Error: Failed to trigger workflow: {e}")
+        return ENVIRONMENT_DEFAULTS[env_type]
+    except KeyError:
+        print(f"Error: Unknown environment type '{env_type}'")
+        print(f"Valid types are: {', '.join(ENVIRONMENT_DEFAULTS)}")
         sys.exit(1)
 
 def _get_github_token() -> str:
-    token = os.getenv("WORKFLOW_RUNNER_PAT")
-    if not token:
+    return next(_resolve_github_tokens(os.getenv("WORKFLOW_RUNNER_PATS"), os.getenv("WORKFLOW_RUNNER_PAT")))
+
+@lru_cache(maxsize=4)
+def _resolve_github_tokens(tokens: Optional[str], token: Optional[str]) -> Iterator[str]:
+    """
+    Validate the personal access tokens read from the environment and cycle through them.
+
+    A comma-separated list of tokens in WORKFLOW_RUNNER_PATS is used in turn, one per workflow, to
+    spread the requests across the rate limits of several accounts. Otherwise the single token in
+    WORKFLOW_RUNNER_PAT is used. The cache is keyed on the environment values, so the parsing is
+    done once, but a change to the variables during the run is still picked up.
+
+    Args:
+        tokens: The value of the WORKFLOW_RUNNER_PATS environment variable
+        token: The value of the WORKFLOW_RUNNER_PAT environment variable
+
+    Returns:
+        Iterator[str]: An endless iterator over the validated tokens
+
+    Raises:
+        ValueError: If no token is set
+    """
+    parsed = [t.strip() for t in tokens.split(",") if t.strip()] if tokens else []
+    if not parsed and token:
+        parsed = [token]
+    if not parsed:
         raise ValueError("WORKFLOW_RUNNER_PAT environment variable is not set")
-    return token
+    return cycle(parsed)
 
 def _print_workflow_banner() -> None:
     """Print a banner for the workflow command."""
-    banner_text = "R U N  W O R K F L O W"
-    total_width = 61
-    padding = (total_width - len(banner_text)) // 2
-    
-    print("=" * total_width)
-    print(" " * padding + banner_text + " " * (total_width - padding - len(banner_text)))
-    print("=" * total_width + "\n")
+    sys.stdout.write(_WORKFLOW_BANNER)
+
+# Keyed by a presence mask of (version, branch, repo owner); any combination not listed is invalid.
+_TESTNET_DEPLOY_ARGS_FORMATS = {
+    0b000: "".format,
+    0b100: "--version {0}".format,
+    0b011: "--branch {1} --repo-owner {2}".format,
+}
 
 def _build_testnet_deploy_args(config: Dict) -> str:
     """
@@ -888,19 +883,32 @@ def _build_testnet_deploy_args(config: Dict) -> str:
     Raises:
         ValueError: If invalid combination of testnet-deploy inputs are provided
     """
-    version = config.get("testnet-deploy-version")
-    branch = config.get("testnet-deploy-branch")
-    repo_owner = config.get("testnet-deploy-repo-owner")
+    return _format_testnet_deploy_args(
+        config.get("testnet-deploy-version"),
+        config.get("testnet-deploy-branch"),
+        config.get("testnet-deploy-repo-owner"),
+    )
+
+def _format_testnet_deploy_args(version: Any, branch: Any, repo_owner: Any) -> str:
+    """
+    Format the testnet-deploy-args string for a combination of testnet-deploy inputs.
     
-    if version and (branch or repo_owner):
-        raise ValueError("Cannot specify both testnet-deploy-version and testnet-deploy-branch/repo-owner")
+    Args:
+        version: The testnet-deploy-version input
+        branch: The testnet-deploy-branch input
+        repo_owner: The testnet-deploy-repo-owner input
         
-    if bool(branch) != bool(repo_owner):
+    Returns:
+        str: The constructed testnet-deploy-args string
+        
+    Raises:
+        ValueError: If invalid combination of testnet-deploy inputs are provided
+    """
+    mask = (bool(version) << 2) | (bool(branch) << 1) | bool(repo_owner)
+    build_args = _TESTNET_DEPLOY_ARGS_FORMATS.get(mask)
+    if build_args is None:
+        if mask & 0b100:
+            raise ValueError("Cannot specify both testnet-deploy-version and testnet-deploy-branch/repo-owner")
         raise ValueError("testnet-deploy-branch and testnet-deploy-repo-owner must be used together")
         
-    if version:
-        return f"--version {version}"
-    elif branch and repo_owner:
-        return f"--branch {branch} --repo-owner {repo_owner}"
-    
-    return ""
+    return build_args(version, branch, repo_owner)
@@ -1,22 +1,87 @@
 # This module seems pointless, but it exists to remove an issue with circular referencing between
 # the models and the db modules.
+import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DB_PATH = Path.home() / ".local" / "share" / "autonomi" / "workflow_runs2.db"
 DB_URL = f"sqlite:///{DB_PATH}"
 
-engine = create_engine(DB_URL)
+# orjson reads integers outside the 64-bit range as floats, which would corrupt values like wallet
+# addresses parsed from hex in the YAML inputs, so documents with long digit runs use the standard
+# library parser.
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+
+def _json_deserializer(text: str):
+    """
+    Decode a JSON column, using orjson when it is installed and can decode the value exactly.
+    """
+    if orjson is None or _LONG_DIGIT_RUN.search(text):
+        return json.loads(text)
+    return orjson.loads(text)
+
+def _json_serializer(value) -> str:
+    """
+    Encode a JSON column, using orjson when it is installed and supports the value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # Raised for integers outside the 64-bit range and for non-string keys.
+            pass
+    return json.dumps(value)
+
+# The listing and reporting queries are built from a fixed set of statements, so a larger statement
+# cache on the connection means each one is only parsed by SQLite once per process.
+engine = create_engine(
+    DB_URL,
+    json_serializer=_json_serializer,
+    json_deserializer=_json_deserializer,
+    connect_args={"cached_statements": 256},
+)
+
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection, connection_record):
+    """
+    Apply connection pragmas. WAL lets listing commands read while another process is recording
+    a run, and the engine's pool keeps the configured connection for reuse within the process.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-def get_db():
+@lru_cache(maxsize=1)
+def _create_schema() -> None:
     """
-    Get a database session. Creates database and tables if they don't exist.
+    Create the database and tables if they don't exist, once per process.
+    
+    Indexes added to existing tables are left to the Alembic migrations, which would otherwise fail
+    to create them.
     """
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     Base.metadata.create_all(bind=engine)
+
+def get_db():
+    """
+    Get a database session. Creates database and tables if they don't exist.
+    """
+    _create_schema()
     db = SessionLocal()
     try:
         yield db
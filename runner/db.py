@@ -1,7 +1,8 @@
 from datetime import datetime, UTC
-from typing import Any, Dict, Optional, TypeVar, Generic, Type
+from typing import Any, Dict, Iterator, Mapping, Optional, TypeVar, Generic, Type
 from .database import get_db
 from .models import (
+    BaseDeployment,
     ClientDeployment,
     ClientSmokeTestResult,
     Comparison,
@@ -16,8 +17,8 @@ from .models import (
     WorkflowRun,
     NetworkDeployment,
 )
-from sqlalchemy import select
-from sqlalchemy.orm import aliased
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Query, aliased, joinedload, with_polymorphic
 
 T = TypeVar('T')
 
@@ -50,6 +51,32 @@ class ComparisonRepository(BaseRepository[Comparison]):
     def __init__(self):
         super().__init__(Comparison)
 
+    def get_with_deployments(self, comparison_id: int) -> Optional[Comparison]:
+        """
+        Get a comparison with its reference and test deployments loaded in the same query.
+        
+        The deployments are loaded with the columns of their network or client tables, so building
+        a report from them does not go back to the database for each one.
+        
+        Args:
+            comparison_id: The ID of the comparison
+            
+        Returns:
+            Optional[Comparison]: The comparison, or None if there is no comparison with the ID
+        """
+        ref_deployment = with_polymorphic(BaseDeployment, "*", flat=True)
+        test_deployment = with_polymorphic(BaseDeployment, "*", flat=True)
+        return (
+            self.db.query(Comparison)
+            .options(
+                joinedload(Comparison.ref_deployment.of_type(ref_deployment)),
+                joinedload(Comparison.test_deployments)
+                .joinedload(ComparisonDeployment.deployment.of_type(test_deployment)),
+            )
+            .filter(Comparison.id == comparison_id)
+            .first()
+        )
+
     def create_comparison(
             self, ref_id: int, test_ids: list[tuple[int, Optional[str]]],
             ref_label: Optional[str] = None, description: Optional[str] = None,
@@ -97,6 +124,21 @@ class ComparisonRepository(BaseRepository[Comparison]):
         self.close()
 
     def list_comparisons(self) -> list[ComparisonSummary]:
+        return list(self.iter_comparisons())
+
+    def iter_comparisons(self, batch_size: int = 100) -> Iterator[ComparisonSummary]:
+        """
+        Stream summaries of the comparisons.
+        
+        The comparisons are fetched in batches as they are consumed, so the whole table is never
+        loaded, and only the names of the deployments are read for the titles.
+        
+        Args:
+            batch_size: The number of comparisons to fetch at a time
+            
+        Yields:
+            ComparisonSummary view models, ordered by created_at ascending
+        """
         try:
             comparisons_stmt = (
                 select(
@@ -110,20 +152,20 @@ class ComparisonRepository(BaseRepository[Comparison]):
                     Comparison.created_at,
                 )
                 .order_by(Comparison.created_at.asc())
+                .execution_options(yield_per=batch_size)
             )
             
-            comparisons_results = self.db.execute(comparisons_stmt).all()
-            summaries = []
-            
-            for row in comparisons_results:
+            for row in self.db.execute(comparisons_stmt):
                 deployment_type = row.deployment_type
                 if deployment_type == DeploymentType.NETWORK:
                     deployment_model = NetworkDeployment
                 else:
                     deployment_model = ClientDeployment
                     
-                ref_deployment = self.db.query(deployment_model).filter(deployment_model.id == row.ref_id).first()
-                if not ref_deployment:
+                ref_name = self.db.execute(
+                    select(deployment_model.name).where(deployment_model.id == row.ref_id)
+                ).scalar()
+                if ref_name is None:
                     continue
                     
                 test_envs = (
@@ -137,18 +179,16 @@ class ComparisonRepository(BaseRepository[Comparison]):
                 for deployment, label in test_envs:
                     title += f"{label} [{deployment}] vs "
                 title = title[:-4]
-                title += f" vs {row.ref_label} [{ref_deployment.name}]"
+                title += f" vs {row.ref_label} [{ref_name}]"
                 
-                summaries.append(ComparisonSummary(
+                yield ComparisonSummary(
                     id=row.id,
                     title=title,
                     thread_link=row.thread_link,
                     description=row.description,
                     created_at=row.created_at,
                     deployment_type=deployment_type.value,
-                ))
-                
-            return summaries
+                )
         finally:
             self.db.close()
 
@@ -224,8 +264,35 @@ class NetworkDeploymentRepository(BaseRepository[NetworkDeployment]):
         finally:
             self.db.close()
 
+    def list_deployment_rows(self) -> list[Row]:
+        """
+        Retrieve the columns needed for the compact listing of deployments.
+        
+        The timestamp is formatted by SQLite, so no model instances are built and no datetime is
+        converted in Python for each row.
+        
+        Returns:
+            Rows of (id, name, triggered_at, related_pr, run_id), ordered by the triggered_at of the
+            workflow run ascending, where triggered_at is formatted as YYYY-MM-DD HH:MM:SS
+        """
+        try:
+            return (
+                self.db.query(
+                    NetworkDeployment.id,
+                    NetworkDeployment.name,
+                    func.strftime("%Y-%m-%d %H:%M:%S", NetworkDeployment.triggered_at).label("triggered_at"),
+                    NetworkDeployment.related_pr,
+                    NetworkDeployment.run_id
+                )
+                .join(WorkflowRun, NetworkDeployment.workflow_run_id == WorkflowRun.run_id)
+                .order_by(WorkflowRun.triggered_at.asc())
+                .all()
+            )
+        finally:
+            self.db.close()
+
     def record_deployment(
-            self, workflow_run_id: int, config: Dict[str, Any], defaults: Dict[str, Any],
+            self, workflow_run_id: int, config: Dict[str, Any], defaults: Mapping[str, Any],
             is_legacy: bool = False, is_bootstrap: bool = False) -> None:
         """
         Record a deployment in the database using SQLAlchemy.
@@ -233,7 +300,7 @@ class NetworkDeploymentRepository(BaseRepository[NetworkDeployment]):
         Args:
             workflow_run_id: ID of the associated workflow run
             config: Dictionary containing deployment configuration
-            defaults: Dictionary containing default values for the environment type
+            defaults: Read-only mapping of default values for the environment type
             is_legacy: Whether the deployment is a legacy deployment
             is_bootstrap: Whether the deployment is a bootstrap deployment
         """
@@ -331,6 +398,25 @@ class NetworkDeploymentRepository(BaseRepository[NetworkDeployment]):
     def get_smoke_test_result(self, deployment_id: int) -> Optional[SmokeTestResult]:
         return self.db.query(SmokeTestResult).filter(SmokeTestResult.deployment_id == deployment_id).first()
 
+    def get_smoke_test_results(self) -> Dict[int, Dict[str, str]]:
+        """
+        Retrieve the smoke test answers for all deployments in a single query.
+        
+        Where a deployment has more than one recorded smoke test, the first one is used, as it is
+        by get_smoke_test_result.
+        
+        Returns:
+            A dictionary of the smoke test answers, keyed by deployment ID
+        """
+        try:
+            results = {}
+            rows = self.db.query(SmokeTestResult.deployment_id, SmokeTestResult.results).order_by(SmokeTestResult.id)
+            for deployment_id, answers in rows:
+                results.setdefault(deployment_id, answers)
+            return results
+        finally:
+            self.close()
+
     def get_recent_deployments(self) -> list[RecentDeployment]:
         """Get the 10 most recent deployments.
         
@@ -371,6 +457,31 @@ class ClientDeploymentRepository(BaseRepository[ClientDeployment]):
         finally:
             self.close()
 
+    def list_client_deployment_rows(self) -> list[Row]:
+        """
+        Retrieve the columns needed for the compact listing of client deployments.
+        
+        As with the network deployments, the timestamp is formatted by SQLite rather than in Python.
+        
+        Returns:
+            Rows of (id, name, triggered_at, related_pr, run_id), ordered by triggered_at ascending,
+            where triggered_at is formatted as YYYY-MM-DD HH:MM:SS
+        """
+        try:
+            return (
+                self.db.query(
+                    ClientDeployment.id,
+                    ClientDeployment.name,
+                    func.strftime("%Y-%m-%d %H:%M:%S", ClientDeployment.triggered_at).label("triggered_at"),
+                    ClientDeployment.related_pr,
+                    ClientDeployment.run_id
+                )
+                .order_by(ClientDeployment.triggered_at.asc())
+                .all()
+            )
+        finally:
+            self.close()
+
     def record_client_deployment(self, workflow_run_id: int, config: Dict[str, Any]) -> None:
         """Record a client deployment in the database.
         
@@ -446,6 +557,25 @@ class ClientDeploymentRepository(BaseRepository[ClientDeployment]):
     def get_smoke_test_result(self, deployment_id: int) -> Optional[ClientSmokeTestResult]:
         return self.db.query(ClientSmokeTestResult).filter(ClientSmokeTestResult.deployment_id == deployment_id).first()
 
+    def get_smoke_test_results(self) -> Dict[int, Dict[str, str]]:
+        """
+        Retrieve the smoke test answers for all client deployments in a single query.
+        
+        Where a deployment has more than one recorded smoke test, the first one is used, as it is
+        by get_smoke_test_result.
+        
+        Returns:
+            A dictionary of the smoke test answers, keyed by deployment ID
+        """
+        try:
+            results = {}
+            rows = self.db.query(ClientSmokeTestResult.deployment_id, ClientSmokeTestResult.results).order_by(ClientSmokeTestResult.id)
+            for deployment_id, answers in rows:
+                results.setdefault(deployment_id, answers)
+            return results
+        finally:
+            self.close()
+
     def get_recent_deployments(self) -> list[RecentDeployment]:
         """Get the 10 most recent deployments.
         
@@ -480,18 +610,129 @@ class WorkflowRunRepository(BaseRepository[WorkflowRun]):
     def __init__(self):
         super().__init__(WorkflowRun)
 
-    def list_workflow_runs(self) -> list[WorkflowRun]:
+    def list_workflow_runs(
+        self,
+        workflow_name: Optional[str] = None,
+        network_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        before: Optional[datetime] = None,
+        since: Optional[datetime] = None
+    ) -> list[WorkflowRun]:
         """
-        Retrieve all workflow runs from the database.
+        Retrieve workflow runs from the database.
         
+        Args:
+            workflow_name: Only include runs whose workflow name contains this text (case-insensitive)
+            network_name: Only include runs whose network name contains this text (case-insensitive)
+            limit: Only include this many of the most recent matching runs
+            before: Only include runs triggered before this time, for paging back through older runs
+            since: Only include runs triggered at or after this time
+            
         Returns:
-            List of WorkflowRun model instances, ordered by triggered_at descending
+            List of WorkflowRun model instances, ordered by triggered_at ascending
+        """
+        return list(self.iter_workflow_runs(workflow_name, network_name, limit, before, since))
+
+    def iter_workflow_runs(
+        self,
+        workflow_name: Optional[str] = None,
+        network_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        before: Optional[datetime] = None,
+        since: Optional[datetime] = None,
+        batch_size: int = 100
+    ) -> Iterator[WorkflowRun]:
+        """
+        Stream workflow runs from the database.
+        
+        The filtering, ordering and limit are applied in the query, using the index on triggered_at,
+        and rows are fetched in batches as they are consumed, so the full history is never loaded.
+        
+        Args:
+            workflow_name: Only include runs whose workflow name contains this text (case-insensitive)
+            network_name: Only include runs whose network name contains this text (case-insensitive)
+            limit: Only include this many of the most recent matching runs
+            before: Only include runs triggered before this time, for paging back through older runs
+            since: Only include runs triggered at or after this time
+            batch_size: The number of rows to fetch at a time
+            
+        Yields:
+            WorkflowRun model instances, ordered by triggered_at ascending
         """
         try:
-            return (
-                self.db.query(WorkflowRun)
-                .order_by(WorkflowRun.triggered_at.asc())
-                .all()
+            query, run = self._workflow_runs_query(
+                workflow_name, network_name, limit, before, since)
+            yield from query.order_by(run.triggered_at.asc()).yield_per(batch_size)
+        finally:
+            self.db.close()
+
+    def iter_workflow_run_rows(
+        self,
+        workflow_name: Optional[str] = None,
+        network_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        before: Optional[datetime] = None,
+        since: Optional[datetime] = None,
+        batch_size: int = 100
+    ) -> Iterator[Row]:
+        """
+        Stream the columns needed for the compact listing of workflow runs.
+        
+        Only the timestamp, workflow name, network name and run ID are selected, with the timestamp already
+        formatted by SQLite, so no model instances are built and the inputs are not decoded.
+        
+        Args:
+            workflow_name: Only include runs whose workflow name contains this text (case-insensitive)
+            network_name: Only include runs whose network name contains this text (case-insensitive)
+            limit: Only include this many of the most recent matching runs
+            before: Only include runs triggered before this time, for paging back through older runs
+            since: Only include runs triggered at or after this time
+            batch_size: The number of rows to fetch at a time
+            
+        Yields:
+            Rows of (triggered_at, workflow_name, network_name, run_id), ordered by triggered_at
+            ascending, where triggered_at is formatted as YYYY-MM-DD HH:MM:SS
+        """
+        try:
+            query, run = self._workflow_runs_query(
+                workflow_name, network_name, limit, before, since)
+            query = query.with_entities(
+                func.strftime("%Y-%m-%d %H:%M:%S", run.triggered_at).label("triggered_at"),
+                run.workflow_name,
+                run.network_name,
+                run.run_id
             )
+            yield from query.order_by(run.triggered_at.asc()).yield_per(batch_size)
         finally:
             self.db.close()
+
+    def _workflow_runs_query(
+        self,
+        workflow_name: Optional[str],
+        network_name: Optional[str],
+        limit: Optional[int],
+        before: Optional[datetime],
+        since: Optional[datetime]
+    ) -> tuple[Query, Any]:
+        """
+        Build the query for the workflow runs matching the given filters.
+        
+        Returns:
+            The query, and the entity to select columns from and order by
+        """
+        query = self.db.query(WorkflowRun)
+        if workflow_name:
+            query = query.filter(
+                func.lower(WorkflowRun.workflow_name).contains(workflow_name.lower(), autoescape=True))
+        if network_name:
+            query = query.filter(
+                func.lower(WorkflowRun.network_name).contains(network_name.lower(), autoescape=True))
+        if before:
+            query = query.filter(WorkflowRun.triggered_at < before)
+        if since:
+            query = query.filter(WorkflowRun.triggered_at >= since)
+        if limit is None:
+            return query, WorkflowRun
+        recent = query.order_by(WorkflowRun.triggered_at.desc()).limit(limit).subquery()
+        run = aliased(WorkflowRun, recent)
+        return self.db.query(run), run
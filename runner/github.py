@@ -1,18 +1,201 @@
 #!/usr/bin/env python
 
+import json
 import os
+import threading
 import toml
 from collections import defaultdict
-from github import Github
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from github import Github, GithubException
+from github.PullRequest import PullRequest
 from pathlib import Path
 
-def has_breaking_change(commits):
-    for commit in commits:
-        commit_message = commit.commit.message
+from runner.cache import read_cached_pull_requests, write_cached_pull_requests
+
+REPO_OWNER = "maidsafe"
+AUTONOMI_REPO_NAME = "autonomi"
+
+@lru_cache(maxsize=1)
+def _get_token():
+    token = os.getenv("ANT_RUNNER_PR_LIST_GITHUB_TOKEN")
+    if not token:
+        raise Exception("The ANT_RUNNER_PR_LIST_GITHUB_TOKEN environment variable must be set")
+    return token
+
+# PRs fetched per GraphQL query. Each one brings up to 100 commits, so this keeps a query well
+# inside GitHub's limit on the number of nodes it can return.
+_PREFETCH_BATCH_SIZE = 50
+
+# PRs fetched at once over REST; kept small to stay clear of GitHub's secondary rate limits.
+_FETCH_WORKERS = 8
+
+_PREFETCH_FIELDS = """
+    number
+    title
+    url
+    closedAt
+    mergedAt
+    author { login }
+    commits(first: 100) { totalCount nodes { commit { message } } }
+"""
+
+@lru_cache(maxsize=1)
+def _get_cached_pulls():
+    # Read once per process; lookups add to this copy, which is saved back after each of them.
+    return read_cached_pull_requests()
+
+def _create_repo():
+    # PyGithub already retries rate limited requests and server errors with a backoff.
+    return Github(_get_token()).get_repo(f"{REPO_OWNER}/{AUTONOMI_REPO_NAME}", lazy=True)
+
+@lru_cache(maxsize=1)
+def _get_repo():
+    # One client is shared by the lookups on the main thread so its connection to the API is reused.
+    return _create_repo()
+
+_worker_clients = threading.local()
+
+def _get_worker_repo():
+    # A PyGithub client keeps the state of the request in flight on its one connection, so clients
+    # can't be shared between threads; each fetch worker gets its own.
+    if not hasattr(_worker_clients, "repo"):
+        _worker_clients.repo = _create_repo()
+    return _worker_clients.repo
+
+def _get_pull_request_in_worker(pr_num, cached_pulls):
+    return _get_pull_request(_get_worker_repo(), pr_num, cached_pulls)
+
+def _has_breaking_message(commit_messages):
+    for commit_message in commit_messages:
         if '!' in commit_message.split('\n')[0] or 'BREAKING CHANGE' in commit_message:
             return True
     return False
 
+def has_breaking_change(commits):
+    return _has_breaking_message(commit.commit.message for commit in commits)
+
+def _parse_cached_pull_request(cached):
+    return {
+        **cached,
+        "closed_at": cached["closed_at"] and datetime.fromisoformat(cached["closed_at"]),
+        "merged_at": cached["merged_at"] and datetime.fromisoformat(cached["merged_at"]),
+    }
+
+def _get_pull_request(repo, pr_num, cached_pulls):
+    """Get the details of a PR, reusing the saved copy if there is one.
+    
+    PRs that were closed when they were fetched are reused as they are, because from then on the
+    details used here no longer change. Open PRs are saved with their ETag, which is sent back the
+    next time; if the PR has not changed, GitHub answers with 304 Not Modified, which does not count
+    against the rate limit, and its commits do not need to be checked again. The copy in
+    `cached_pulls` is updated when a PR is fetched.
+    
+    Args:
+        repo: The repository the PR belongs to
+        pr_num: The PR number
+        cached_pulls: The saved PRs, keyed on PR number
+        
+    Returns:
+        The number, title, author, closing and merge times, URL and whether the PR has a breaking
+        change
+    """
+    cached = cached_pulls.get(str(pr_num))
+    if cached and not cached.get("etag"):
+        return _parse_cached_pull_request(cached)
+
+    # The PR is requested directly rather than with get_pull, so that the one request both
+    # revalidates the saved copy and, if the PR has changed, brings its new details.
+    status, headers, output = repo.requester.requestJson(
+        "GET", f"{repo.url}/pulls/{pr_num}", headers={"If-None-Match": cached["etag"]} if cached else None)
+    if status == 304:
+        return _parse_cached_pull_request(cached)
+    data = json.loads(output) if output else None
+    if status != 200:
+        raise GithubException(status, data, headers)
+
+    print(f"Processing #{pr_num}...")
+    pull = PullRequest(repo.requester, headers, data, completed=True)
+    details = {
+        "number": pull.number,
+        "title": pull.title,
+        "author": pull.user.login,
+        "closed_at": pull.closed_at,
+        "merged_at": pull.merged_at,
+        "url": pull.html_url,
+        "breaking": has_breaking_change(pull.get_commits()),
+    }
+    cached_pulls[str(pr_num)] = {
+        **details,
+        "closed_at": pull.closed_at and pull.closed_at.isoformat(),
+        "merged_at": pull.merged_at and pull.merged_at.isoformat(),
+        "etag": None if pull.closed_at else pull.etag,
+    }
+    return details
+
+def _prefetch_pull_requests(repo, pr_numbers, cached_pulls):
+    """Save the closed PRs that have not been saved yet, fetching them in batches with GraphQL.
+    
+    One GraphQL query replaces the two REST requests per PR for the PR and its commits. Open PRs,
+    and PRs with too many commits to fetch in one go, are left to be fetched one at a time.
+    
+    Args:
+        repo: The repository the PRs belong to
+        pr_numbers: The PR numbers
+        cached_pulls: The saved PRs, keyed on PR number, which fetched PRs are added to
+    """
+    missing = [pr_num for pr_num in dict.fromkeys(pr_numbers) if str(pr_num) not in cached_pulls]
+    for start in range(0, len(missing), _PREFETCH_BATCH_SIZE):
+        batch = missing[start:start + _PREFETCH_BATCH_SIZE]
+        print(f"Fetching {len(batch)} PRs...")
+        fields = " ".join(f"pr{pr_num}: pullRequest(number: {pr_num}) {{ {_PREFETCH_FIELDS} }}" for pr_num in batch)
+        query = f'query {{ repository(owner: "{REPO_OWNER}", name: "{AUTONOMI_REPO_NAME}") {{ {fields} }} }}'
+        try:
+            _, data = repo.requester.graphql_query(query, {})
+        except GithubException:
+            # Fetching the PRs one at a time reports the error against the PR that caused it.
+            continue
+        
+        for pr_num in batch:
+            pull = data["data"]["repository"][f"pr{pr_num}"]
+            commits = pull["commits"]
+            if not pull["closedAt"] or commits["totalCount"] > len(commits["nodes"]):
+                continue
+            cached_pulls[str(pr_num)] = {
+                "number": pull["number"],
+                "title": pull["title"],
+                "author": pull["author"]["login"] if pull["author"] else "ghost",
+                "closed_at": pull["closedAt"],
+                "merged_at": pull["mergedAt"],
+                "url": pull["url"],
+                "breaking": _has_breaking_message(node["commit"]["message"] for node in commits["nodes"]),
+                "etag": None,
+            }
+
+def _fetch_pull_requests(repo, pr_numbers, cached_pulls):
+    """Start getting the details of several PRs.
+    
+    PRs that cannot be fetched in a GraphQL batch are fetched concurrently rather than one after
+    another, with a client per worker thread. A PR that appears more than once is only looked up
+    once.
+    
+    Args:
+        repo: The repository the PRs belong to
+        pr_numbers: The PR numbers
+        cached_pulls: The saved PRs, keyed on PR number, which fetched PRs are added to
+        
+    Returns:
+        A future for the details of each PR, in the same order as `pr_numbers`
+    """
+    _prefetch_pull_requests(repo, pr_numbers, cached_pulls)
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+        futures = {
+            pr_num: executor.submit(_get_pull_request_in_worker, pr_num, cached_pulls)
+            for pr_num in dict.fromkeys(pr_numbers)
+        }
+    return [futures[pr_num] for pr_num in pr_numbers]
+
 def read_pr_numbers(file_path):
     with open(file_path, 'r') as file:
         return [int(line.strip()) for line in file]
@@ -31,29 +214,18 @@ def get_crate_version(crate_name):
     return version
 
 def get_pr_list(pr_numbers):
-    token = os.getenv("ANT_RUNNER_PR_LIST_GITHUB_TOKEN")
-    if not token:
-        raise Exception("The ANT_RUNNER_PR_LIST_GITHUB_TOKEN environment variable must be set")
-
-    g = Github(token)
-    repo = g.get_repo("maidsafe/autonomi")
+    repo = _get_repo()
 
+    cached_pulls = _get_cached_pulls()
     pulls = []
-    for pr_num in pr_numbers:
-        print(f"Processing #{pr_num}...")
-        pull = repo.get_pull(pr_num)
-        if not pull.closed_at and not pull.merged_at:
-            raise Exception(f"PR {pr_num} has not been closed yet")
-        commits = pull.get_commits()
-        breaking = has_breaking_change(commits)
-        pulls.append({
-            "number": pull.number,
-            "title": pull.title,
-            "author": pull.user.login,
-            "closed_at": pull.closed_at,
-            "breaking": breaking,
-            "commits": commits
-        })
+    try:
+        for pr_num, future in zip(pr_numbers, _fetch_pull_requests(repo, pr_numbers, cached_pulls)):
+            pull = future.result()
+            if not pull["closed_at"] and not pull["merged_at"]:
+                raise Exception(f"PR {pr_num} has not been closed yet")
+            pulls.append(pull)
+    finally:
+        write_cached_pull_requests(cached_pulls)
     pulls.sort(key=lambda pr: pr["closed_at"])
 
     markdown_lines = []
@@ -101,32 +273,20 @@ def get_merged_prs_by_author(pr_numbers):
     Raises:
         Exception: If any PR in the list is not closed
     """
-    token = os.getenv("ANT_RUNNER_PR_LIST_GITHUB_TOKEN")
-    if not token:
-        raise Exception("The ANT_RUNNER_PR_LIST_GITHUB_TOKEN environment variable must be set")
-
-    g = Github(token)
-    repo = g.get_repo("maidsafe/autonomi")
+    repo = _get_repo()
 
+    cached_pulls = _get_cached_pulls()
     pulls = []
-    for pr_num in pr_numbers:
-        print(f"Processing #{pr_num}...")
-        pull = repo.get_pull(pr_num)
-        if not pull.closed_at:
-            raise Exception(f"PR {pr_num} has not been closed yet")
-        if not pull.merged_at:
-            raise Exception(f"PR {pr_num} was closed but not merged")
-        
-        commits = pull.get_commits()
-        breaking = has_breaking_change(commits)
-        pulls.append({
-            "number": pull.number,
-            "title": pull.title,
-            "author": pull.user.login,
-            "closed_at": pull.closed_at,
-            "breaking": breaking,
-            "commits": commits
-        })
+    try:
+        for pr_num, future in zip(pr_numbers, _fetch_pull_requests(repo, pr_numbers, cached_pulls)):
+            pull = future.result()
+            if not pull["closed_at"]:
+                raise Exception(f"PR {pr_num} has not been closed yet")
+            if not pull["merged_at"]:
+                raise Exception(f"PR {pr_num} was closed but not merged")
+            pulls.append(pull)
+    finally:
+        write_cached_pull_requests(cached_pulls)
     
     pulls.sort(key=lambda pr: pr["closed_at"])
 
@@ -152,29 +312,23 @@ def get_breaking_prs(pr_numbers):
     Args:
         pr_numbers: List of PR numbers to retrieve
     """
-    token = os.getenv("ANT_RUNNER_PR_LIST_GITHUB_TOKEN")
-    if not token:
-        raise Exception("The ANT_RUNNER_PR_LIST_GITHUB_TOKEN environment variable must be set")
-
-    g = Github(token)
-    repo = g.get_repo("maidsafe/autonomi")
+    repo = _get_repo()
 
+    cached_pulls = _get_cached_pulls()
     breaking_prs = []
-    for pr_num in pr_numbers:
-        print(f"Processing #{pr_num}...")
+    for pr_num, future in zip(pr_numbers, _fetch_pull_requests(repo, pr_numbers, cached_pulls)):
         try:
-            pull = repo.get_pull(pr_num)
-            commits = pull.get_commits()
-            
-            if has_breaking_change(commits):
+            pull = future.result()
+            if pull["breaking"]:
                 breaking_prs.append({
                     "number": pr_num,
-                    "title": pull.title,
-                    "author": pull.user.login,
-                    "url": pull.html_url
+                    "title": pull["title"],
+                    "author": pull["author"],
+                    "url": pull["url"]
                 })
 
         except Exception as e:
             print(f"Error processing PR #{pr_num}: {e}")
             continue
-    return breaking_prs
\ No newline at end of file
+    write_cached_pull_requests(cached_pulls)
+    return breaking_prs
@@ -3,8 +3,13 @@ import os
 import requests
 import sys
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+# Creating an issue or project takes several lookups against the same endpoint, so one session keeps
+# the connection open between them.
+_SESSION = requests.Session()
+
 class Team(Enum):
     INFRASTRUCTURE = "Infrastructure"
     QA = "QA"
@@ -369,9 +374,13 @@ def create_project_update(project_id: str, body: str, team: Team) -> str:
     else:
         raise ValueError(f"Failed to create project update. Response data: {update_result}")
 
+@lru_cache(maxsize=None)
 def _get_api_key(team: Team) -> str:
     """Get the Linear API key for a team.
     
+    The key is read from the environment once per team, since a single command can make several
+    API requests. A missing key is not cached, because the error is raised instead.
+    
     Args:
         team: The team
         
@@ -404,7 +413,7 @@ def _make_linear_api_request(query: str, variables: Dict, team: Team) -> Dict:
     api_key = _get_api_key(team)
     
     try:
-        response = requests.post(
+        response = _SESSION.post(
             "https://api.linear.app/graphql",
             json={"query": query, "variables": variables},
             headers={
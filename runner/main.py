@@ -1,12 +1,12 @@
 import argparse
 import logging
 import sys
-from typing import Dict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
 
 import yaml
 
-from runner.cmd import client_deployments, comparisons, deployments, workflows, releases
-
 def load_yaml_config(file_path: str) -> Dict:
     """Load and parse the YAML configuration file."""
     try:
@@ -26,6 +26,24 @@ def load_yaml_config(file_path: str) -> Dict:
         print(f"Error parsing YAML file: {e}")
         sys.exit(1)
 
+def load_batch_config(file_path: str) -> List[Tuple[str, Dict]]:
+    """
+    Load a batch file, and the inputs file for each workflow it lists.
+    
+    The batch file is a list of entries with a `command` key, naming a workflows subcommand, and a
+    `path` key, giving its inputs file relative to the batch file.
+    """
+    batch = load_yaml_config(file_path)
+    if not isinstance(batch, list):
+        print(f"Error: The batch file at {file_path} must contain a list of workflows")
+        sys.exit(1)
+    base_path = Path(file_path).parent
+    try:
+        return [(entry["command"], load_yaml_config(base_path / entry["path"])) for entry in batch]
+    except (KeyError, TypeError):
+        print("Error: Each workflow in the batch file must have a command and a path")
+        sys.exit(1)
+
 def main():
     parser = argparse.ArgumentParser(
         description="CLI tool to stop testnet nodes via GitHub Actions"
@@ -404,6 +422,19 @@ def main():
         help="Skip confirmation prompt before dispatching workflow"
     )
 
+    dispatch_batch_parser = workflows_subparsers.add_parser(
+        "dispatch-batch", help="Dispatch several independent workflows concurrently")
+    dispatch_batch_parser.add_argument(
+        "--path",
+        required=True,
+        help="Path to a batch file listing the workflow subcommands and their inputs files"
+    )
+    dispatch_batch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Skip confirmation prompts before dispatching the workflows"
+    )
+
     drain_funds_parser = workflows_subparsers.add_parser("drain-funds", help="Drain funds from network nodes")
     drain_funds_parser.add_argument(
         "--path",
@@ -453,7 +484,9 @@ def main():
     )
 
     ls_parser = workflows_subparsers.add_parser("ls", help="List all workflow runs")
-    ls_parser.add_argument(
+    # The status is only shown in the compact listing.
+    ls_view_group = ls_parser.add_mutually_exclusive_group()
+    ls_view_group.add_argument(
         "--details",
         action="store_true",
         help="Show detailed information for each workflow run"
@@ -466,6 +499,26 @@ def main():
         "--network-name",
         help="Filter workflow runs by network name"
     )
+    ls_parser.add_argument(
+        "--limit",
+        type=int,
+        help="Only show this many of the most recent workflow runs"
+    )
+    ls_parser.add_argument(
+        "--before",
+        type=datetime.fromisoformat,
+        help="Only show workflow runs triggered before this UTC time (e.g. 2025-06-01T12:00:00)"
+    )
+    ls_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only show workflow runs triggered at or after this UTC time (e.g. 2025-06-01)"
+    )
+    ls_view_group.add_argument(
+        "--status",
+        action="store_true",
+        help="Fetch the current status of each workflow run from GitHub"
+    )
 
     network_status_parser = workflows_subparsers.add_parser("network-status", help="Check status of testnet nodes")
     network_status_parser.add_argument(
@@ -756,6 +809,7 @@ def main():
         )
     
     if args.command == "client-deployments":
+        from runner.cmd import client_deployments
         if args.client_deployments_command == "ls":
             client_deployments.ls(show_details=args.details)
         elif args.client_deployments_command == "linear":
@@ -774,6 +828,7 @@ def main():
             client_deployments_parser.print_help()
             sys.exit(1)
     elif args.command == "comparisons":
+        from runner.cmd import comparisons
         if args.comparisons_command == "add-thread":
             comparisons.add_thread(args.id, args.link)
         elif args.comparisons_command == "linear":
@@ -798,6 +853,7 @@ def main():
             comparisons_parser.print_help()
             sys.exit(1)
     elif args.command == "deployments":
+        from runner.cmd import deployments
         if args.deployments_command == "dev":
             deployments.dev(args.name)
         elif args.deployments_command == "download-report":
@@ -822,6 +878,7 @@ def main():
             deployments_parser.print_help()
             sys.exit(1)
     elif args.command == "releases":
+        from runner.cmd import releases
         if args.releases_command == "breaking":
             releases.breaking(args.path)
         elif args.releases_command == "new":
@@ -832,92 +889,28 @@ def main():
             releases_parser.print_help()
             sys.exit(1)
     elif args.command == "workflows":
-        if args.workflows_command == "bootstrap-network":
-            config = load_yaml_config(args.path)
-            workflows.bootstrap_network(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "client-deploy":
-            config = load_yaml_config(args.path)
-            workflows.client_deploy(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "client-deploy-static-downloaders":
-            config = load_yaml_config(args.path)
-            workflows.client_deploy_static_downloaders(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "deposit-funds":
-            config = load_yaml_config(args.path)
-            workflows.deposit_funds(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "destroy-network":
-            config = load_yaml_config(args.path)
-            workflows.destroy_network(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "drain-funds":
-            config = load_yaml_config(args.path)
-            workflows.drain_funds(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "kill-droplets":
-            config = load_yaml_config(args.path)
-            workflows.kill_droplets(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "launch-legacy-network":
+        from runner.cmd import workflows
+        if args.workflows_command == "launch-legacy-network":
             config = load_yaml_config(args.path)
             workflows.launch_legacy_network(config, "main", args.force, args.wait)
-        elif args.workflows_command == "launch-network":
-            config = load_yaml_config(args.path)
-            workflows.launch_network(config, args.branch, args.force, args.wait)
+        elif args.workflows_command == "dispatch-batch":
+            commands = load_batch_config(args.path)
+            workflows.dispatch_batch(commands, args.branch, args.force, args.wait)
         elif args.workflows_command == "ls":
-            workflows.ls(show_details=args.details, workflow_name=args.name, network_name=args.network_name)
-        elif args.workflows_command == "network-status":
-            config = load_yaml_config(args.path)
-            workflows.network_status(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "nginx-upgrade-config":
-            config = load_yaml_config(args.path)
-            workflows.nginx_upgrade_config(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "reset-to-n-nodes":
-            config = load_yaml_config(args.path)
-            workflows.reset_to_n_nodes(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "start-downloaders":
-            config = load_yaml_config(args.path)
-            workflows.start_downloaders(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "start-nodes":
-            config = load_yaml_config(args.path)
-            workflows.start_nodes(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "start-telegraf":
-            config = load_yaml_config(args.path)
-            workflows.start_telegraf(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "start-uploaders":
-            config = load_yaml_config(args.path)
-            workflows.start_uploaders(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "stop-downloaders":
-            config = load_yaml_config(args.path)
-            workflows.stop_downloaders(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "stop-nodes":
-            config = load_yaml_config(args.path)
-            workflows.stop_nodes(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "stop-telegraf":
-            config = load_yaml_config(args.path)
-            workflows.stop_telegraf(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "stop-uploaders":
-            config = load_yaml_config(args.path)
-            workflows.stop_uploaders(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "telegraf-upgrade-client-config":
-            config = load_yaml_config(args.path)
-            workflows.telegraf_upgrade_client_config(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "telegraf-upgrade-geoip-config":
-            config = load_yaml_config(args.path)
-            workflows.telegraf_upgrade_geoip_config(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "telegraf-upgrade-node-config":
-            config = load_yaml_config(args.path)
-            workflows.telegraf_upgrade_node_config(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "update-peer":
-            config = load_yaml_config(args.path)
-            workflows.update_peer(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "upgrade-antctl":
-            config = load_yaml_config(args.path)
-            workflows.upgrade_antctl(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "upgrade-clients":
-            config = load_yaml_config(args.path)
-            workflows.upgrade_clients(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "upgrade-network":
-            config = load_yaml_config(args.path)
-            workflows.upgrade_network(config, args.branch, args.force, args.wait)
-        elif args.workflows_command == "upscale-network":
+            workflows.ls(
+                show_details=args.details,
+                workflow_name=args.name,
+                network_name=args.network_name,
+                limit=args.limit,
+                before=args.before,
+                since=args.since,
+                show_status=args.status
+            )
+        elif args.workflows_command:
+            # Every other subcommand dispatches a workflow through the function of the same name.
+            dispatch = getattr(workflows, args.workflows_command.replace("-", "_"))
             config = load_yaml_config(args.path)
-            workflows.upscale_network(config, args.branch, args.force, args.wait)
+            dispatch(config, args.branch, args.force, args.wait)
         else:
             workflows_parser.print_help()
             sys.exit(1)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, ForeignKey, Enum as SqlEnum
-from sqlalchemy.orm import relationship, mapped_column
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, ForeignKey, Enum as SqlEnum, func
+from sqlalchemy.orm import relationship, mapped_column, column_property
 from sqlalchemy.orm.collections import attribute_mapped_collection
 from sqlalchemy.orm import backref
 from .database import Base
@@ -15,7 +15,7 @@ class WorkflowRun(Base):
     workflow_name = Column(String, nullable=False)
     branch_name = Column(String, nullable=False)
     network_name = Column(String, nullable=False)
-    triggered_at = Column(DateTime, nullable=False)
+    triggered_at = Column(DateTime, nullable=False, index=True)
     inputs = Column(JSON, nullable=False)
     run_id = Column(Integer, nullable=False)
 
@@ -30,7 +30,7 @@ class BaseDeployment(Base):
     deployment_type = Column(SqlEnum(DeploymentType), nullable=False)
     workflow_run_id = Column(Integer, ForeignKey("workflow_runs.id"), nullable=False)
     name = Column(String, nullable=False)
-    triggered_at = Column(DateTime, nullable=False)
+    triggered_at = Column(DateTime, nullable=False, index=True)
     run_id = Column(Integer, nullable=False)
     description = Column(String)
     region = Column(String, nullable=False, default="lon1")
@@ -80,6 +80,16 @@ class NetworkDeployment(BaseDeployment):
     symmetric_private_node_count = Column(Integer)
     symmetric_private_vm_count = Column(Integer)
     symmetric_nat_gateway_vm_size = Column(String)
+
+    # Totals are calculated by SQLite as the rows are loaded. A node type that isn't deployed has a
+    # null count, so its product is null and counts as zero.
+    total_nodes = column_property(
+        generic_vm_count * generic_node_count
+        + func.coalesce(peer_cache_vm_count * peer_cache_node_count, 0)
+        + func.coalesce(full_cone_private_vm_count * full_cone_private_node_count, 0)
+        + func.coalesce(symmetric_private_vm_count * symmetric_private_node_count, 0)
+    )
+    total_uploaders = column_property(func.coalesce(client_vm_count * uploader_count, 0))
     
     __mapper_args__ = {
         "polymorphic_identity": DeploymentType.NETWORK,
@@ -144,7 +154,7 @@ class Comparison(Base):
     deployment_type = Column(SqlEnum(DeploymentType), nullable=False)
     description = Column(String)
     thread_link = Column(String)
-    created_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, nullable=False, index=True)
     ref_label = Column(String)
     passed = Column(Boolean)
 
@@ -221,7 +231,7 @@ class SmokeTestResult(Base):
     __tablename__ = "smoke_test_results"
 
     id = Column(Integer, primary_key=True, index=True)
-    deployment_id = Column(Integer, ForeignKey("base_deployments.id"), nullable=False)
+    deployment_id = Column(Integer, ForeignKey("base_deployments.id"), nullable=False, index=True)
     results = Column(JSON, nullable=False)
     created_at = Column(DateTime, nullable=False)
 
@@ -231,7 +241,7 @@ class ClientSmokeTestResult(Base):
     __tablename__ = "client_smoke_test_results"
 
     id = Column(Integer, primary_key=True, index=True)
-    deployment_id = Column(Integer, ForeignKey("client_deployments.id"), nullable=False)
+    deployment_id = Column(Integer, ForeignKey("client_deployments.id"), nullable=False, index=True)
     results = Column(JSON, nullable=False)
     created_at = Column(DateTime, nullable=False)
 
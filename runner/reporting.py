@@ -1,4 +1,6 @@
-from typing import List
+import re
+from datetime import datetime
+from typing import List, Tuple
 from runner.db import ClientDeploymentRepository, NetworkDeploymentRepository
 from runner.models import ClientDeployment, Comparison, DeploymentType, NetworkDeployment
 
@@ -6,6 +8,61 @@ REPO_OWNER = "maidsafe"
 REPO_NAME = "sn-testnet-workflows"
 AUTONOMI_REPO_NAME = "autonomi"
 
+EVM_TYPE_DISPLAY = {
+    "anvil": "Anvil",
+    "arbitrum-one": "Arbitrum One",
+    "arbitrum-sepolia": "Arbitrum Sepolia",
+    "custom": "Custom",
+}
+
+def _heading(text: str) -> Tuple[str, str, str]:
+    rule = "=" * len(text)
+    return (rule, text, rule)
+
+# Section headings shared by the reports, built once rather than on every report.
+_VERSION_DETAILS_HEADING = _heading("Version Details")
+_CUSTOM_BRANCH_HEADING = _heading("Custom Branch Details")
+_NODE_CONFIGURATION_HEADING = _heading("Node Configuration")
+_CLIENT_CONFIGURATION_HEADING = _heading("Client Configuration")
+_MISC_CONFIGURATION_HEADING = _heading("Misc Configuration")
+_EVM_CONFIGURATION_HEADING = _heading("EVM Configuration")
+
+_TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse a timestamp entered as YYYY-MM-DD HH:MM:SS.
+    
+    The format is checked with a precompiled pattern and the value is then parsed with
+    fromisoformat, which is implemented in C, rather than with strptime, which compiles and matches
+    a regular expression in pure Python on every call.
+    
+    Args:
+        value: The timestamp
+        
+    Returns:
+        datetime: The parsed timestamp
+        
+    Raises:
+        ValueError: If the timestamp is not in the expected format or is not a valid date and time
+    """
+    if not _TIMESTAMP_PATTERN.fullmatch(value):
+        raise ValueError(f"'{value}' does not match the format YYYY-MM-DD HH:MM:SS")
+    return datetime.fromisoformat(value)
+
+def format_timestamp(value: datetime) -> str:
+    """Format a timestamp read from the database as YYYY-MM-DD HH:MM:SS.
+    
+    This uses isoformat, which is implemented in C and several times faster than the equivalent
+    strftime call, because it is called for every row of the listings.
+    
+    Args:
+        value: The timestamp, which is naive because SQLite does not store time zones
+        
+    Returns:
+        str: The formatted timestamp
+    """
+    return value.isoformat(" ", "seconds")
+
 def build_comparison_report(comparison: Comparison) -> str:
     """Build a detailed report about a specific comparison.
     
@@ -70,14 +127,9 @@ def build_deployment_report(deployment: NetworkDeployment) -> List[str]:
         List[str]: Lines of formatted deployment details
     """
     lines = []
-    lines.append(f"Deployed: {deployment.triggered_at.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"Deployed: {format_timestamp(deployment.triggered_at)}")
     
-    evm_type_display = {
-        "anvil": "Anvil",
-        "arbitrum-one": "Arbitrum One",
-        "arbitrum-sepolia": "Arbitrum Sepolia", 
-        "custom": "Custom"
-    }.get(deployment.evm_network_type, deployment.evm_network_type)
+    evm_type_display = EVM_TYPE_DISPLAY.get(deployment.evm_network_type, deployment.evm_network_type)
     
     lines.append(f"EVM Type: {evm_type_display}")
     lines.append(f"Workflow run: https://github.com/{REPO_OWNER}/{REPO_NAME}/actions/runs/{deployment.run_id}")
@@ -87,17 +139,13 @@ def build_deployment_report(deployment: NetworkDeployment) -> List[str]:
         lines.append(f"Link: https://github.com/{REPO_OWNER}/{AUTONOMI_REPO_NAME}/pull/{deployment.related_pr}")
 
     if deployment.ant_version:
-        lines.append(f"===============")
-        lines.append(f"Version Details")
-        lines.append(f"===============")
+        lines.extend(_VERSION_DETAILS_HEADING)
         lines.append(f"Ant: {deployment.ant_version}")
         lines.append(f"Antnode: {deployment.antnode_version}")
         lines.append(f"Antctl: {deployment.antctl_version}")
 
     if deployment.branch:
-        lines.append(f"=====================")
-        lines.append(f"Custom Branch Details")
-        lines.append(f"=====================")
+        lines.extend(_CUSTOM_BRANCH_HEADING)
         lines.append(f"Branch: {deployment.branch}")
         lines.append(f"Repo Owner: {deployment.repo_owner}")
         lines.append(f"Link: https://github.com/{deployment.repo_owner}/{AUTONOMI_REPO_NAME}/tree/{deployment.branch}")
@@ -106,34 +154,20 @@ def build_deployment_report(deployment: NetworkDeployment) -> List[str]:
         if deployment.antnode_features:
             lines.append(f"Antnode Features: {deployment.antnode_features}")
 
-    lines.append(f"==================")
-    lines.append(f"Node Configuration")
-    lines.append(f"==================")
+    lines.extend(_NODE_CONFIGURATION_HEADING)
     lines.append(f"Peer cache nodes: {deployment.peer_cache_vm_count}x{deployment.peer_cache_node_count} [{deployment.peer_cache_node_vm_size}]")
     lines.append(f"Generic nodes: {deployment.generic_vm_count}x{deployment.generic_node_count} [{deployment.generic_node_vm_size}]")
     lines.append(f"Full cone private nodes: {deployment.full_cone_private_vm_count}x{deployment.full_cone_private_node_count} [{deployment.generic_node_vm_size}]")
     lines.append(f"Symmetric private nodes: {deployment.symmetric_private_vm_count}x{deployment.symmetric_private_node_count} [{deployment.generic_node_vm_size}]")
-    total_nodes = deployment.generic_vm_count * deployment.generic_node_count
-    if deployment.peer_cache_vm_count and deployment.peer_cache_node_count:
-        total_nodes += deployment.peer_cache_vm_count * deployment.peer_cache_node_count
-    if deployment.full_cone_private_vm_count and deployment.full_cone_private_node_count:
-        total_nodes += deployment.full_cone_private_vm_count * deployment.full_cone_private_node_count
-    if deployment.symmetric_private_vm_count and deployment.symmetric_private_node_count:
-        total_nodes += deployment.symmetric_private_vm_count * deployment.symmetric_private_node_count
-    lines.append(f"Total: {total_nodes}")
+    lines.append(f"Total: {deployment.total_nodes}")
 
     if deployment.client_vm_count and deployment.uploader_count:
-        lines.append(f"====================")
-        lines.append(f"Client Configuration")
-        lines.append(f"====================")
+        lines.extend(_CLIENT_CONFIGURATION_HEADING)
         lines.append(f"{deployment.client_vm_count}x{deployment.uploader_count} [{deployment.client_vm_size}]")
-        total_uploaders = deployment.client_vm_count * deployment.uploader_count
-        lines.append(f"Total: {total_uploaders}")
+        lines.append(f"Total: {deployment.total_uploaders}")
 
     if deployment.max_log_files or deployment.max_archived_log_files or deployment.client_env or deployment.node_env:
-        lines.append(f"==================")
-        lines.append(f"Misc Configuration")
-        lines.append(f"==================")
+        lines.extend(_MISC_CONFIGURATION_HEADING)
         if deployment.client_env:
             lines.append(f"Client vars: {deployment.client_env}")
         if deployment.max_log_files:
@@ -143,12 +177,10 @@ def build_deployment_report(deployment: NetworkDeployment) -> List[str]:
         if deployment.node_env:
             lines.append(f"Node vars: {deployment.node_env}")
         
-    if any([deployment.evm_data_payments_address, 
-            deployment.evm_payment_token_address, 
-            deployment.evm_rpc_url]):
-        lines.append(f"=================")
-        lines.append(f"EVM Configuration")
-        lines.append(f"=================")
+    if (deployment.evm_data_payments_address or
+            deployment.evm_payment_token_address or
+            deployment.evm_rpc_url):
+        lines.extend(_EVM_CONFIGURATION_HEADING)
         if deployment.evm_data_payments_address:
             lines.append(f"Data Payments Address: {deployment.evm_data_payments_address}")
         if deployment.evm_payment_token_address:
@@ -167,7 +199,7 @@ def build_client_deployment_report(deployment: ClientDeployment) -> List[str]:
     Returns:
         List[str]: Lines of formatted deployment details
     """
-    timestamp = deployment.triggered_at.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = format_timestamp(deployment.triggered_at)
     lines = []
 
     lines.append(f"Deployed: {timestamp}")
@@ -180,16 +212,12 @@ def build_client_deployment_report(deployment: ClientDeployment) -> List[str]:
 
     if deployment.ant_version:
         lines.append("")
-        lines.append(f"===============")
-        lines.append(f"Version Details")
-        lines.append(f"===============")
+        lines.extend(_VERSION_DETAILS_HEADING)
         lines.append(f"Ant: {deployment.ant_version}")
 
     if deployment.branch:
         lines.append("")
-        lines.append(f"=====================")
-        lines.append(f"Custom Branch Details")
-        lines.append(f"=====================")
+        lines.extend(_CUSTOM_BRANCH_HEADING)
         lines.append(f"Branch: {deployment.branch}")
         lines.append(f"Repo Owner: {deployment.repo_owner}")
         lines.append(f"Link: https://github.com/{deployment.repo_owner}/{AUTONOMI_REPO_NAME}/tree/{deployment.branch}")
@@ -197,9 +225,7 @@ def build_client_deployment_report(deployment: ClientDeployment) -> List[str]:
             lines.append(f"Chunk Size: {deployment.chunk_size}")
 
     lines.append("")
-    lines.append(f"====================")
-    lines.append(f"Client Configuration")
-    lines.append(f"====================")
+    lines.extend(_CLIENT_CONFIGURATION_HEADING)
     lines.append(f"VMs: {deployment.client_vm_count} [{deployment.client_vm_size}]")
     if deployment.disable_uploaders:
         lines.append(f"Uploaders: disabled")
@@ -232,15 +258,8 @@ def build_client_deployment_report(deployment: ClientDeployment) -> List[str]:
             lines.append(f"Peer: {deployment.peer}")
         
     lines.append("")
-    lines.append(f"=================")
-    lines.append(f"EVM Configuration")
-    lines.append(f"=================")
-    evm_type_display = {
-        "anvil": "Anvil",
-        "arbitrum-one": "Arbitrum One",
-        "arbitrum-sepolia": "Arbitrum Sepolia", 
-        "custom": "Custom"
-    }.get(deployment.evm_network_type, deployment.evm_network_type)
+    lines.extend(_EVM_CONFIGURATION_HEADING)
+    evm_type_display = EVM_TYPE_DISPLAY.get(deployment.evm_network_type, deployment.evm_network_type)
     lines.append(f"Type: {evm_type_display}")
     if deployment.evm_data_payments_address:
         lines.append(f"Data Payments Address: {deployment.evm_data_payments_address}")
@@ -2,14 +2,18 @@ import json
 import logging
 import sys
 import time
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich import print as rprint
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from urllib3.util.retry import Retry
 
+from runner.cache import read_cached_response, write_cached_response
 from runner.db import WorkflowRunRepository
 from runner.models import WorkflowRun as WorkflowRunModel
 
@@ -32,6 +36,197 @@ NETWORK_IDS = {
     "STG-11": 29, "STG-12": 30, "STG-13": 31, "STG-14": 32, "STG-15": 33
 }
 
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session for talking to the GitHub API.
+    
+    Connections are pooled so the TCP and TLS handshakes are shared by every request made in the
+    process. Idempotent requests are retried with backoff on rate limiting and transient server
+    errors; workflow dispatches are never retried, to avoid triggering the same run twice.
+    
+    Returns:
+        requests.Session: The configured session
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "ant-network-workflow-runner"})
+    return session
+
+_SESSION = create_session()
+
+# Longest wait for a rate limit to reset before a dispatch is retried; beyond this the error is
+# reported instead, since the primary limit can take up to an hour to reset.
+_MAX_RATE_LIMIT_WAIT = 300
+
+def _get_rate_limit_wait(response: requests.Response) -> Optional[float]:
+    """
+    Get how long to wait before retrying a request that was rejected by a GitHub rate limit.
+    
+    Args:
+        response: The response to the request
+        
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the request was not rate limited
+        or the limit will not reset within _MAX_RATE_LIMIT_WAIT
+    """
+    if response.status_code not in (403, 429):
+        return None
+    
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        wait = float(retry_after)
+    elif response.headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in response.headers:
+        wait = max(float(response.headers["X-RateLimit-Reset"]) - time.time(), 0) + 1
+    elif response.status_code == 429:
+        # GitHub asks for at least a minute between retries when it gives no other guidance.
+        wait = 60
+    else:
+        # A 403 without rate limit headers is a permissions problem, which a retry won't fix.
+        return None
+    return wait if wait <= _MAX_RATE_LIMIT_WAIT else None
+
+def poll_until(fetch: Callable[[], Any], predicate: Callable[[Any], bool], initial: float = 2.0,
+               factor: float = 1.5, cap: float = 30.0, timeout: Optional[float] = None) -> Any:
+    """
+    Call a function repeatedly until its result satisfies a condition.
+    
+    The next call is only scheduled once the previous one has returned, and the wait between calls
+    grows exponentially up to a cap, so a long wait makes few requests.
+    
+    Args:
+        fetch: Called to get the latest result
+        predicate: Called with each result; polling stops once it returns True
+        initial: The number of seconds to wait after the first call
+        factor: The amount the wait is multiplied by after each call
+        cap: The longest wait between calls, in seconds
+        timeout: The longest time to keep polling, in seconds, or None to poll indefinitely
+        
+    Returns:
+        Any: The first result that satisfied the predicate
+        
+    Raises:
+        TimeoutError: If the predicate is not satisfied before the timeout
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    attempt = 0
+    while True:
+        result = fetch()
+        if predicate(result):
+            return result
+        delay = min(cap, initial * factor ** attempt)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise TimeoutError(f"Condition was not met within {timeout} seconds")
+        time.sleep(delay)
+        attempt += 1
+
+# GitHub stops listing workflow runs after this many results when they are filtered by date.
+_RUN_LISTING_LIMIT = 1000
+
+def _get_cached_json(session: requests.Session, url: str, headers: Dict[str, str],
+                     params: Dict[str, Any]) -> Any:
+    """
+    Make a GET request, revalidating any saved copy of the response with its ETag.
+    
+    Args:
+        session: The session to make the request with
+        url: The URL to request
+        headers: The headers to send with the request
+        params: The query parameters of the request
+        
+    Returns:
+        Any: The decoded body of the response, or of the saved copy if it has not changed
+        
+    Raises:
+        requests.exceptions.RequestException: If the API request fails
+    """
+    cached = read_cached_response(url, params)
+    if cached:
+        headers = {**headers, "If-None-Match": cached[0]}
+    response = session.get(url, headers=headers, params=params)
+    response.raise_for_status()
+    if response.status_code == 304 and cached:
+        return cached[1]
+    body = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        write_cached_response(url, params, etag, body)
+    return body
+
+def fetch_run_states(owner: str, repo: str, personal_access_token: str, run_ids: List[int],
+                     created_since: datetime, created_until: datetime,
+                     session: Optional[requests.Session] = None) -> Dict[int, str]:
+    """
+    Get the state of several workflow runs using as few API requests as possible.
+    
+    Rather than requesting each run individually, the runs for the repository are listed a page at
+    a time, between the dates the earliest and latest runs were created. Each page is revalidated
+    against the copy saved by the previous listing, so pages that have not changed since are answered
+    with 304 Not Modified and do not count against the rate limit.
+    
+    GitHub only returns the first 1,000 runs of a listing filtered by date, so any runs that are
+    still missing once the listing is exhausted are requested individually.
+    
+    Args:
+        owner: The owner of the repository the workflows run in
+        repo: The name of the repository the workflows run in
+        personal_access_token: The token used to authenticate with the API
+        run_ids: The IDs of the workflow runs
+        created_since: The time the earliest of the runs was created
+        created_until: The time the latest of the runs was created
+        session: The session to make the requests with
+        
+    Returns:
+        Dict[int, str]: The conclusion of each completed run, or the status of each run that is
+        still in progress; runs that could not be found are omitted
+        
+    Raises:
+        requests.exceptions.RequestException: If the API request fails
+    """
+    session = session or _SESSION
+    url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs"
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {personal_access_token}",
+    }
+    # The runs are recorded when they are dispatched, so GitHub may create the latest one just
+    # after midnight of the following day.
+    params = {
+        "per_page": 100,
+        "page": 1,
+        "created": f"{created_since:%Y-%m-%d}..{created_until + timedelta(days=1):%Y-%m-%d}",
+        "exclude_pull_requests": "true",
+    }
+    
+    remaining = set(run_ids)
+    states = {}
+    while remaining:
+        workflow_runs = _get_cached_json(session, url, headers, params).get("workflow_runs", [])
+        for run in workflow_runs:
+            if run["id"] in remaining:
+                states[run["id"]] = run["conclusion"] or run["status"]
+                remaining.discard(run["id"])
+        if len(workflow_runs) < params["per_page"] or params["page"] * params["per_page"] >= _RUN_LISTING_LIMIT:
+            break
+        params["page"] += 1
+    
+    for run_id in remaining:
+        try:
+            run = _get_cached_json(session, f"{url}/{run_id}", headers, {})
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                continue
+            raise
+        states[run_id] = run["conclusion"] or run["status"]
+    return states
+
 def confirm_workflow_dispatch(workflow_name: str, inputs: Dict[str, Any]) -> bool:
     """
     Display workflow information and prompt for confirmation.
@@ -50,6 +245,62 @@ def confirm_workflow_dispatch(workflow_name: str, inputs: Dict[str, Any]) -> boo
     response = input().lower()
     return response in ["y", "yes"]
 
+_LAUNCH_NODE_COUNT_INPUTS = (
+    "peer-cache-node-count",
+    "generic-node-count",
+    "full-cone-private-node-count",
+    "symmetric-private-node-count",
+    "uploader-count",
+)
+_LAUNCH_VM_COUNT_INPUTS = (
+    "peer-cache-vm-count",
+    "generic-vm-count",
+    "full-cone-private-vm-count",
+    "symmetric-private-vm-count",
+    "client-vm-count",
+)
+_LEGACY_NODE_COUNT_INPUTS = (
+    "bootstrap-node-count",
+    "generic-node-count",
+    "private-node-count",
+    "uploader-count",
+)
+_LEGACY_VM_COUNT_INPUTS = (
+    "bootstrap-vm-count",
+    "generic-vm-count",
+    "private-vm-count",
+    "client-vm-count",
+)
+_BOOTSTRAP_NODE_COUNT_INPUTS = (
+    "full-cone-private-node-count",
+    "symmetric-private-node-count",
+    "generic-node-count",
+)
+_BOOTSTRAP_VM_COUNT_INPUTS = (
+    "full-cone-private-vm-count",
+    "symmetric-private-vm-count",
+    "generic-vm-count",
+)
+
+def _format_node_vm_counts(config: Dict[str, Any], node_count_inputs: Tuple[str, ...],
+                           vm_count_inputs: Tuple[str, ...]) -> Optional[str]:
+    """
+    Build the node-vm-counts workflow input from the node and VM counts present in a config.
+    
+    Args:
+        config: Dictionary containing workflow configuration
+        node_count_inputs: The node count inputs, in the order the workflow expects them
+        vm_count_inputs: The VM count inputs, in the order the workflow expects them
+        
+    Returns:
+        Optional[str]: The input value, or None if the config has no node counts or no VM counts
+    """
+    node_counts = ", ".join(str(config[name]) for name in node_count_inputs if name in config)
+    vm_counts = ", ".join(str(config[name]) for name in vm_count_inputs if name in config)
+    if node_counts and vm_counts:
+        return f"({node_counts}), ({vm_counts})"
+    return None
+
 class WorkflowRunFailedError(Exception):
     """Exception raised when a workflow run fails."""
     def __init__(self, run_id, conclusion):
@@ -58,21 +309,40 @@ class WorkflowRunFailedError(Exception):
         super().__init__(f"Workflow run {run_id} failed with conclusion: {conclusion}")
 
 class WorkflowRun:
+    __slots__ = (
+        "owner",
+        "repo",
+        "id",
+        "personal_access_token",
+        "branch_name",
+        "name",
+        "session",
+        "_inputs",
+        "_run_status_etag",
+        "_run_status",
+        "headers",
+    )
+
     def __init__(self, owner: str, repo: str, id: int, 
-                 personal_access_token: str, branch_name: str, name: str):
+                 personal_access_token: str, branch_name: str, name: str,
+                 session: Optional[requests.Session] = None):
         self.owner = owner
         self.repo = repo
         self.id = id
         self.personal_access_token = personal_access_token
         self.branch_name = branch_name
         self.name = name
+        self.session = session or _SESSION
+        self._inputs = None
+        self._run_status_etag = None
+        self._run_status = None
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
             "Authorization": f"token {personal_access_token}"
         }
 
     def _trigger_workflow(self) -> requests.Response:
-        """Trigger the workflow via GitHub API."""
+        """Trigger the workflow via GitHub API, retrying once if the request is rate limited."""
         url = f"https://api.github.com/repos/{self.owner}/{self.repo}/actions/workflows/{self.id}/dispatches"
         
         headers = {
@@ -82,13 +352,22 @@ class WorkflowRun:
         
         data = {
             "ref": self.branch_name,
-            "inputs": self.get_workflow_inputs()
+            "inputs": self.inputs,
+            # Ask for the new run's ID in the response, to save looking it up afterwards.
+            "return_run_details": True
         }
 
         logging.debug("Request URL: %s", url)
         logging.debug("Request payload: %s", data)
         
-        return requests.post(url, headers=headers, json=data)
+        response = self.session.post(url, headers=headers, json=data)
+        # A rate limited dispatch was not accepted, so unlike other failures it is safe to send again.
+        wait = _get_rate_limit_wait(response)
+        if wait is not None:
+            print(f"GitHub rate limit reached; retrying the {self.name} dispatch in {wait:.0f} seconds...")
+            time.sleep(wait)
+            response = self.session.post(url, headers=headers, json=data)
+        return response
 
     def _get_workflow_run_id(self) -> int:
         """Get the ID of the most recently triggered workflow run."""
@@ -99,7 +378,17 @@ class WorkflowRun:
             "Authorization": f"Bearer {self.personal_access_token}",
         }
         
-        response = requests.get(url, headers=headers)
+        # Only runs of this workflow dispatched on the same branch in the last hour can be the one
+        # that was just triggered, so there is no need to page through its whole history.
+        created_since = datetime.now(UTC) - timedelta(hours=1)
+        params = {
+            "branch": self.branch_name,
+            "event": "workflow_dispatch",
+            "created": f">={created_since:%Y-%m-%dT%H:%M:%SZ}",
+            "exclude_pull_requests": "true",
+        }
+        # The query is different for every dispatch, so it is not saved for revalidation with its ETag.
+        response = self.session.get(url, headers=headers, params=params)
         response.raise_for_status()
         
         workflow_runs = response.json().get("workflow_runs", [])
@@ -108,7 +397,6 @@ class WorkflowRun:
         if not active_runs:
             raise RuntimeError("Could not find workflow run ID for recently triggered workflow")
         
-        from datetime import datetime
         active_runs.sort(key=lambda x: datetime.fromisoformat(x["created_at"].replace('Z', '+00:00')), reverse=True)
         
         return active_runs[0]["id"]
@@ -152,56 +440,62 @@ class WorkflowRun:
         """
         Wait for the workflow run to complete.
         
+        The run's status is checked after a short wait at first, then less often as the run goes
+        on, up to once every poll_interval seconds.
+        
         Args:
             run_id: The workflow run ID to monitor
-            poll_interval: Time in seconds between status checks
+            poll_interval: The longest time in seconds between status checks
             
         Raises:
             WorkflowRunFailedError: If the workflow run completes with a non-success conclusion
         """
         print(f"\nWaiting for workflow run {run_id} to complete...")
         
-        max_retries = 5
-        retry_delay = 5
-        
-        while True:
+        def check_status() -> Optional[str]:
             try:
                 status = self._get_run_status(run_id)
-                if status == "completed":
-                    url = f"https://api.github.com/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/attempts/1"
-                    
-                    for retry in range(max_retries):
-                        try:
-                            response = requests.get(url, headers=self.headers)
-                            response.raise_for_status()
-                            conclusion = response.json().get("conclusion")
-                            
-                            print(f"\nWorkflow run {run_id} completed with conclusion: {conclusion}")
-                            if conclusion != "success":
-                                raise WorkflowRunFailedError(run_id, conclusion)
-                            return
-                        except (requests.exceptions.RequestException, requests.exceptions.ConnectionError, 
-                                requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
-                            if retry < max_retries - 1:
-                                print(f"Error getting conclusion, retrying in {retry_delay} seconds: {str(e)}")
-                                time.sleep(retry_delay)
-                                retry_delay *= 1.5  # Exponential backoff
-                            else:
-                                print(f"Max retries exceeded when getting conclusion: {str(e)}")
-                                raise
-                
+            except (requests.exceptions.RequestException, requests.exceptions.ConnectionError, 
+                    requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
+                print(f"\nNetwork error when checking status, will retry: {str(e)}")
+                return None
+            if status != "completed":
                 print(".", end="", flush=True)
-                time.sleep(poll_interval)
+            return status
+        
+        poll_until(check_status, lambda status: status == "completed", initial=5, cap=poll_interval)
+        
+        url = f"https://api.github.com/repos/{self.owner}/{self.repo}/actions/runs/{run_id}/attempts/1"
+        max_retries = 5
+        retry_delay = 5
+        for retry in range(max_retries):
+            try:
+                response = self.session.get(url, headers=self.headers)
+                response.raise_for_status()
+                conclusion = response.json().get("conclusion")
+                break
             except (requests.exceptions.RequestException, requests.exceptions.ConnectionError, 
                     requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
-                print(f"\nNetwork error when checking status, retrying in {retry_delay} seconds: {str(e)}")
-                time.sleep(retry_delay)
-                retry_delay = min(retry_delay * 1.5, 60)  # Exponential backoff with a maximum of 60 seconds
+                if retry < max_retries - 1:
+                    print(f"Error getting conclusion, retrying in {retry_delay} seconds: {str(e)}")
+                    time.sleep(retry_delay)
+                    retry_delay *= 1.5  # Exponential backoff
+                else:
+                    print(f"Max retries exceeded when getting conclusion: {str(e)}")
+                    raise
+        
+        print(f"\nWorkflow run {run_id} completed with conclusion: {conclusion}")
+        if conclusion != "success":
+            raise WorkflowRunFailedError(run_id, conclusion)
 
     def _get_run_status(self, run_id: int) -> Optional[str]:
         """
         Get the current status of a workflow run.
         
+        The ETag of the last response is sent back with each poll. While the run is unchanged GitHub
+        answers with 304 Not Modified, which does not count against the rate limit, and the status
+        from the previous response is reused.
+        
         Args:
             run_id: The workflow run ID
             
@@ -218,9 +512,16 @@ class WorkflowRun:
         
         for retry in range(max_retries):
             try:
-                response = requests.get(url, headers=self.headers)
+                headers = self.headers
+                if self._run_status_etag:
+                    headers = {**headers, "If-None-Match": self._run_status_etag}
+                response = self.session.get(url, headers=headers)
                 response.raise_for_status()
-                return response.json().get("status")
+                if response.status_code == 304:
+                    return self._run_status
+                self._run_status_etag = response.headers.get("ETag")
+                self._run_status = response.json().get("status")
+                return self._run_status
             except (requests.exceptions.RequestException, requests.exceptions.ConnectionError, 
                     requests.exceptions.Timeout, requests.exceptions.SSLError) as e:
                 if retry < max_retries - 1:
@@ -235,6 +536,18 @@ class WorkflowRun:
         """Get workflow-specific inputs. Should be overridden by subclasses."""
         return {}
 
+    @property
+    def inputs(self) -> Dict[str, Any]:
+        """
+        The workflow inputs, built by get_workflow_inputs on first use.
+        
+        The same inputs are needed for the confirmation prompt, the dispatch request, the database
+        record and the summary printed afterwards, so they are only built once.
+        """
+        if self._inputs is None:
+            self._inputs = self.get_workflow_inputs()
+        return self._inputs
+
     def _confirm_workflow(self) -> None:
         """
         Display workflow information and prompt for confirmation.
@@ -242,7 +555,7 @@ class WorkflowRun:
         Raises:
             SystemExit: If user does not confirm
         """
-        inputs = self.get_workflow_inputs()
+        inputs = self.inputs
         if not confirm_workflow_dispatch(self.name, inputs):
             sys.exit(0)
         else:
@@ -262,27 +575,51 @@ class WorkflowRun:
         response = self._trigger_workflow()
         response.raise_for_status()
         
-        self._display_spinner(2)
+        run_id = _get_dispatched_run_id(response)
+        if run_id is None:
+            self._display_spinner(2)
+            run_id = self._find_workflow_run_id(self._display_spinner)
+        self._record_workflow_run(run_id)
+        return run_id
+
+    def _find_workflow_run_id(self, wait: Callable[[int], None]) -> int:
+        """
+        Get the ID of the triggered workflow run, retrying while it is not yet available.
         
+        Args:
+            wait: Called with the number of seconds to wait before the next attempt
+            
+        Returns:
+            int: The workflow run ID
+            
+        Raises:
+            RuntimeError: If unable to get workflow run ID after multiple attempts
+        """
         attempts = 0
         max_attempts = 3
-        while attempts < max_attempts:
+        while True:
             try:
-                run_id = self._get_workflow_run_id()
-                break
+                return self._get_workflow_run_id()
             except RuntimeError:
                 attempts += 1
                 if attempts == max_attempts:
                     raise
-                self._display_spinner(5)
+                wait(5)
+
+    def _record_workflow_run(self, run_id: int) -> None:
+        """
+        Save the workflow run to the database and print its URL.
         
+        Args:
+            run_id: The workflow run ID
+        """
         repo = WorkflowRunRepository()
         workflow_run = WorkflowRunModel(
             workflow_name=self.name,
             triggered_at=datetime.now(UTC),
             branch_name=self.branch_name,
             network_name=self.network_name,
-            inputs=self.get_workflow_inputs(),
+            inputs=self.inputs,
             run_id=run_id
         )
         repo.save(workflow_run)
@@ -291,8 +628,6 @@ class WorkflowRun:
         print("Workflow run:")
         print(f"https://github.com/{self.owner}/{self.repo}/actions/runs/{run_id}")
         print()
-        
-        return run_id
 
     def _build_testnet_deploy_args(self, config: Dict[str, Any]) -> Optional[str]:
         """
@@ -316,7 +651,118 @@ class WorkflowRun:
             return " ".join(testnet_deploy_args)
         return None
 
+def _get_dispatched_run_id(response: requests.Response) -> Optional[int]:
+    """
+    Get the run ID from a workflow dispatch response, if GitHub included it.
+    
+    A dispatch that returns run details responds with 200 and the ID of the new run. Otherwise it
+    responds with 204 and no body, and the run has to be looked up from the runs list instead.
+    
+    Args:
+        response: The successful response to the dispatch request
+        
+    Returns:
+        Optional[int]: The workflow run ID, or None if the response doesn't include it
+    """
+    if response.status_code != 200:
+        return None
+    try:
+        return response.json().get("workflow_run_id")
+    except ValueError:
+        return None
+
+def _trigger_dispatch(workflow: WorkflowRun) -> Optional[int]:
+    """
+    Trigger a workflow as part of a batch and get its run ID, if GitHub included it.
+    
+    Args:
+        workflow: The workflow to dispatch
+        
+    Returns:
+        Optional[int]: The workflow run ID, or None if it has to be looked up
+        
+    Raises:
+        requests.exceptions.RequestException: If the API request fails
+    """
+    response = workflow._trigger_workflow()
+    response.raise_for_status()
+    return _get_dispatched_run_id(response)
+
+def dispatch_workflows(workflows: List[WorkflowRun], max_workers: int = 8) -> List[int | Exception]:
+    """
+    Dispatch several workflows concurrently, without prompting for confirmation.
+    
+    The dispatch requests and the run ID lookups for all the workflows are made in parallel, so
+    the batch costs about the same as dispatching a single workflow. A failure doesn't stop the
+    rest of the batch: every workflow that was accepted is still recorded, and the failure is
+    returned in its place for the caller to report.
+    
+    Args:
+        workflows: The workflows to dispatch
+        max_workers: The maximum number of concurrent requests
+        
+    Returns:
+        List[int | Exception]: For each workflow, in order, its run ID or the error that stopped it
+        from being dispatched or looked up
+    """
+    if not workflows:
+        return []
+
+    ids = [workflow.id for workflow in workflows]
+    shared_ids = {id for id in ids if ids.count(id) > 1}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(workflows))) as executor:
+        results = _collect_results([executor.submit(_trigger_dispatch, workflow) for workflow in workflows])
+        
+        # The fallback lookup takes the latest run of the workflow, so it can't tell apart the runs
+        # of a workflow that was dispatched more than once in the batch.
+        for i, result in enumerate(results):
+            if result is None and ids[i] in shared_ids:
+                results[i] = RuntimeError(
+                    "The workflow was dispatched, but its run can't be told apart from the other "
+                    f"{workflows[i].name} runs in the batch")
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            workflows[missing[0]]._display_spinner(2)
+            found = _collect_results(
+                [executor.submit(workflows[i]._find_workflow_run_id, time.sleep) for i in missing])
+            for i, result in zip(missing, found):
+                results[i] = result
+
+    for workflow, result in zip(workflows, results):
+        if not isinstance(result, Exception):
+            workflow._record_workflow_run(result)
+    return results
+
+def _collect_results(futures: List[Future]) -> List[Any]:
+    """
+    Get the result of each future, keeping a request or lookup failure in place of its result.
+    
+    Args:
+        futures: The futures to wait for
+        
+    Returns:
+        List[Any]: The result or exception of each future, in the same order
+    """
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except (requests.exceptions.RequestException, RuntimeError) as e:
+            results.append(e)
+    return results
+
 class StopNodesWorkflowRun(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "ansible_forks",
+        "custom_inventory",
+        "delay",
+        "interval",
+        "node_type",
+        "service_names",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int, 
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None, 
@@ -360,6 +806,8 @@ class StopNodesWorkflowRun(WorkflowRun):
         return inputs
 
 class UpgradeAntctlWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "version", "custom_inventory", "node_type", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, version: str,
@@ -390,6 +838,8 @@ class UpgradeAntctlWorkflow(WorkflowRun):
         return inputs
 
 class DestroyNetworkWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, testnet_deploy_args: Optional[str] = None):
@@ -409,6 +859,15 @@ class DestroyNetworkWorkflow(WorkflowRun):
         return inputs
 
 class StopTelegrafWorkflow(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "ansible_forks",
+        "custom_inventory",
+        "delay",
+        "node_type",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int, 
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None, 
@@ -444,6 +903,18 @@ class StopTelegrafWorkflow(WorkflowRun):
         return inputs
 
 class UpgradeNetworkWorkflow(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "version",
+        "ansible_forks",
+        "custom_inventory",
+        "delay",
+        "interval",
+        "node_type",
+        "force",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, version: str,
@@ -490,6 +961,15 @@ class UpgradeNetworkWorkflow(WorkflowRun):
         return inputs
 
 class StartTelegrafWorkflow(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "ansible_forks",
+        "custom_inventory",
+        "delay",
+        "node_type",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int, 
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None, 
@@ -525,6 +1005,8 @@ class StartTelegrafWorkflow(WorkflowRun):
         return inputs
 
 class UpdatePeerWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "peer", "custom_inventory", "node_type")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, peer: str,
@@ -551,6 +1033,8 @@ class UpdatePeerWorkflow(WorkflowRun):
         return inputs
 
 class UpgradeClientsWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "version", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, version: str,
@@ -573,6 +1057,8 @@ class UpgradeClientsWorkflow(WorkflowRun):
         return inputs
 
 class LaunchNetworkWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "config")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str, network_name: str,
                  config: Dict[str, Any]):
@@ -597,16 +1083,16 @@ class LaunchNetworkWorkflow(WorkflowRun):
             if not isinstance(network_id, int) or network_id < 1 or network_id > 255:
                 raise ValueError("network-id must be an integer between 1 and 255")
 
-        has_versions = any([
-            "ant-version" in self.config,
-            "antnode-version" in self.config,
+        has_versions = (
+            "ant-version" in self.config or
+            "antnode-version" in self.config or
             "antctl-version" in self.config
-        ])
+        )
         
-        has_build_config = any([
-            "branch" in self.config,
+        has_build_config = (
+            "branch" in self.config or
             "repo-owner" in self.config
-        ])
+        )
         
         if has_versions and has_build_config:
             raise ValueError("Cannot specify both binary versions and build configuration")
@@ -624,20 +1110,9 @@ class LaunchNetworkWorkflow(WorkflowRun):
         if all(key in self.config for key in ["ant-version", "antnode-version", "antctl-version"]):
             inputs["bin-versions"] = f"{self.config['ant-version']},{self.config['antnode-version']},{self.config['antctl-version']}"
 
-        node_counts = []
-        for count_type in ["peer-cache-node-count", "generic-node-count", "full-cone-private-node-count", 
-                          "symmetric-private-node-count", "uploader-count"]:
-            if count_type in self.config:
-                node_counts.append(str(self.config[count_type]))
-                
-        vm_counts = []
-        for count_type in ["peer-cache-vm-count", "generic-vm-count", "full-cone-private-vm-count", 
-                          "symmetric-private-vm-count", "client-vm-count"]:
-            if count_type in self.config:
-                vm_counts.append(str(self.config[count_type]))
-                
-        if node_counts and vm_counts:
-            inputs["node-vm-counts"] = f"({', '.join(node_counts)}), ({', '.join(vm_counts)})"
+        node_vm_counts = _format_node_vm_counts(self.config, _LAUNCH_NODE_COUNT_INPUTS, _LAUNCH_VM_COUNT_INPUTS)
+        if node_vm_counts:
+            inputs["node-vm-counts"] = node_vm_counts
 
         deploy_args = []
         deploy_arg_mappings = {
@@ -705,6 +1180,8 @@ class LaunchNetworkWorkflow(WorkflowRun):
         return inputs
 
 class ClientDeployWorkflow(WorkflowRun):
+    __slots__ = ("deployment_name", "network_name", "config")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str, deployment_name: str,
                  config: Dict[str, Any]):
@@ -729,10 +1206,10 @@ class ClientDeployWorkflow(WorkflowRun):
                 
         has_version = "ant-version" in self.config
         
-        has_build_config = any([
-            "branch" in self.config,
+        has_build_config = (
+            "branch" in self.config or
             "repo-owner" in self.config
-        ])
+        )
         
         if has_version and has_build_config:
             raise ValueError("Cannot specify both binary version and build configuration")
@@ -807,6 +1284,8 @@ class ClientDeployWorkflow(WorkflowRun):
         return inputs
 
 class ClientDeployStaticDownloadersWorkflow(WorkflowRun):
+    __slots__ = ("deployment_name", "network_name", "config")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str, deployment_name: str,
                  config: Dict[str, Any]):
@@ -832,10 +1311,10 @@ class ClientDeployStaticDownloadersWorkflow(WorkflowRun):
                 
         has_version = "ant-version" in self.config
         
-        has_build_config = any([
-            "branch" in self.config,
+        has_build_config = (
+            "branch" in self.config or
             "repo-owner" in self.config
-        ])
+        )
         
         if has_version and has_build_config:
             raise ValueError("Cannot specify both binary version and build configuration")
@@ -896,6 +1375,8 @@ class ClientDeployStaticDownloadersWorkflow(WorkflowRun):
         return inputs
 
 class KillDropletsWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "droplet_names")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, droplet_names: List[str]):
@@ -910,6 +1391,8 @@ class KillDropletsWorkflow(WorkflowRun):
         }
 
 class UpscaleNetworkWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "config")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, config: Dict[str, Any]):
@@ -973,6 +1456,15 @@ class UpscaleNetworkWorkflow(WorkflowRun):
         return inputs
 
 class DepositFundsWorkflow(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "provider",
+        "funding_wallet_secret_key",
+        "gas_to_transfer",
+        "tokens_to_transfer",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, provider: str,
@@ -1007,6 +1499,15 @@ class DepositFundsWorkflow(WorkflowRun):
         return inputs
 
 class StartNodesWorkflow(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "ansible_forks",
+        "custom_inventory",
+        "interval",
+        "node_type",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int, 
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None, 
@@ -1042,6 +1543,8 @@ class StartNodesWorkflow(WorkflowRun):
         return inputs
 
 class LaunchLegacyNetworkWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "config")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str, network_name: str,
                  config: Dict[str, Any]):
@@ -1057,16 +1560,16 @@ class LaunchLegacyNetworkWorkflow(WorkflowRun):
             if field not in self.config:
                 raise KeyError(field)
                 
-        has_versions = any([
-            "autonomi-version" in self.config,
-            "safenode-version" in self.config,
+        has_versions = (
+            "autonomi-version" in self.config or
+            "safenode-version" in self.config or
             "safenode-manager-version" in self.config
-        ])
+        )
         
-        has_build_config = any([
-            "branch" in self.config,
+        has_build_config = (
+            "branch" in self.config or
             "repo-owner" in self.config
-        ])
+        )
         
         if has_versions and has_build_config:
             raise ValueError("Cannot specify both binary versions and build configuration")
@@ -1087,19 +1590,9 @@ class LaunchLegacyNetworkWorkflow(WorkflowRun):
         if all(key in self.config for key in ["autonomi-version", "safenode-version", "safenode-manager-version"]):
             inputs["bin-versions"] = f"{self.config['autonomi-version']},{self.config['safenode-version']},{self.config['safenode-manager-version']}"
 
-        node_counts = []
-        for count_type in ["bootstrap-node-count", "generic-node-count", "private-node-count", "uploader-count"]:
-            if count_type in self.config:
-                node_counts.append(str(self.config[count_type]))
-                
-        vm_counts = []
-        for count_type in ["bootstrap-vm-count", "generic-vm-count", "private-vm-count", 
-                          "client-vm-count"]:
-            if count_type in self.config:
-                vm_counts.append(str(self.config[count_type]))
-                
-        if node_counts and vm_counts:
-            inputs["node-vm-counts"] = f"({', '.join(node_counts)}), ({', '.join(vm_counts)})"
+        node_vm_counts = _format_node_vm_counts(self.config, _LEGACY_NODE_COUNT_INPUTS, _LEGACY_VM_COUNT_INPUTS)
+        if node_vm_counts:
+            inputs["node-vm-counts"] = node_vm_counts
 
         deploy_args = []
         deploy_arg_mappings = {
@@ -1152,6 +1645,8 @@ class LaunchLegacyNetworkWorkflow(WorkflowRun):
         return inputs
 
 class NetworkStatusWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "ansible_forks", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int, 
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None,
@@ -1175,6 +1670,8 @@ class NetworkStatusWorkflow(WorkflowRun):
         return inputs
 
 class StartUploadersWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, testnet_deploy_args: Optional[str] = None):
@@ -1195,6 +1692,8 @@ class StartUploadersWorkflow(WorkflowRun):
 
 class StopUploadersWorkflow(WorkflowRun):
     """Workflow for stopping uploaders on testnet nodes."""
+    __slots__ = ("network_name", "testnet_deploy_args")
+
     def __init__(
         self,
         owner: str,
@@ -1221,6 +1720,8 @@ class StopUploadersWorkflow(WorkflowRun):
         return inputs
 
 class DrainFundsWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "to_address", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, to_address: Optional[str] = None,
@@ -1244,6 +1745,8 @@ class DrainFundsWorkflow(WorkflowRun):
         return inputs
 
 class BootstrapNetworkWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "environment_type", "config")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str, network_name: str,
                  environment_type: str, config: Dict[str, Any]):
@@ -1265,15 +1768,15 @@ class BootstrapNetworkWorkflow(WorkflowRun):
             if not isinstance(network_id, int) or network_id < 1 or network_id > 255:
                 raise ValueError("network-id must be an integer between 1 and 255")
                 
-        has_versions = any([
-            "antnode-version" in self.config,
+        has_versions = (
+            "antnode-version" in self.config or
             "antctl-version" in self.config
-        ])
+        )
         
-        has_build_config = any([
-            "branch" in self.config,
+        has_build_config = (
+            "branch" in self.config or
             "repo-owner" in self.config
-        ])
+        )
         
         if has_versions and has_build_config:
             raise ValueError("Cannot specify both binary versions and build configuration")
@@ -1298,18 +1801,9 @@ class BootstrapNetworkWorkflow(WorkflowRun):
         if all(key in self.config for key in ["antnode-version", "antctl-version"]):
             inputs["bin-versions"] = f"{self.config['antnode-version']},{self.config['antctl-version']}"
 
-        node_counts = []
-        for count_type in ["full-cone-private-node-count", "symmetric-private-node-count", "generic-node-count"]:
-            if count_type in self.config:
-                node_counts.append(str(self.config[count_type]))
-                
-        vm_counts = []
-        for count_type in ["full-cone-private-vm-count", "symmetric-private-vm-count", "generic-vm-count"]:
-            if count_type in self.config:
-                vm_counts.append(str(self.config[count_type]))
-                
-        if node_counts and vm_counts:
-            inputs["node-vm-counts"] = f"({', '.join(node_counts)}), ({', '.join(vm_counts)})"
+        node_vm_counts = _format_node_vm_counts(self.config, _BOOTSTRAP_NODE_COUNT_INPUTS, _BOOTSTRAP_VM_COUNT_INPUTS)
+        if node_vm_counts:
+            inputs["node-vm-counts"] = node_vm_counts
 
         bootstrap_args = []
         bootstrap_arg_mappings = {
@@ -1355,6 +1849,19 @@ class BootstrapNetworkWorkflow(WorkflowRun):
         return inputs
 
 class ResetToNNodesWorkflow(WorkflowRun):
+    __slots__ = (
+        "network_name",
+        "evm_network_type",
+        "node_count",
+        "custom_inventory",
+        "forks",
+        "node_type",
+        "start_interval",
+        "stop_interval",
+        "version",
+        "testnet_deploy_args",
+    )
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, evm_network_type: str, node_count: str,
@@ -1403,6 +1910,8 @@ class ResetToNNodesWorkflow(WorkflowRun):
         return inputs
 
 class TelegrafUpgradeClientConfigWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "ansible_forks", "ansible_verbose", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None,
@@ -1429,6 +1938,8 @@ class TelegrafUpgradeClientConfigWorkflow(WorkflowRun):
         return inputs
 
 class TelegrafUpgradeGeoipConfigWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "ansible_forks", "ansible_verbose", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None,
@@ -1455,6 +1966,8 @@ class TelegrafUpgradeGeoipConfigWorkflow(WorkflowRun):
         return inputs
 
 class TelegrafUpgradeNodeConfigWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "ansible_forks", "ansible_verbose", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None,
@@ -1481,6 +1994,8 @@ class TelegrafUpgradeNodeConfigWorkflow(WorkflowRun):
         return inputs
 
 class StartDownloadersWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, testnet_deploy_args: Optional[str] = None):
@@ -1497,6 +2012,8 @@ class StartDownloadersWorkflow(WorkflowRun):
         return inputs
 
 class StopDownloadersWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "testnet_deploy_args")
+
     def __init__(
         self,
         owner: str,
@@ -1522,6 +2039,8 @@ class StopDownloadersWorkflow(WorkflowRun):
         return inputs
 
 class NginxUpgradeConfigWorkflow(WorkflowRun):
+    __slots__ = ("network_name", "ansible_forks", "custom_inventory", "testnet_deploy_args")
+
     def __init__(self, owner: str, repo: str, id: int,
                  personal_access_token: str, branch_name: str,
                  network_name: str, ansible_forks: Optional[int] = None,
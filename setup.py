@@ -11,6 +11,9 @@ setup(
     install_requires=[
         str(requirement) for requirement in pkg_resources.parse_requirements(requirements)
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "runner = runner.main:main",